@@ -8,14 +8,10 @@ This script demonstrates basic usage of ThreadStore and FileStore.
 import asyncio
 from narrator import ThreadStore, FileStore, Thread, Message, Attachment
 
-async def thread_store_example():
+async def thread_store_example(store: ThreadStore):
     """Demonstrate ThreadStore usage"""
     print("=== ThreadStore Example ===")
     
-    # Create an in-memory thread store
-    store = await ThreadStore.create()
-    print("Created in-memory ThreadStore")
-    
     # Create a thread
     thread = Thread(title="Example Conversation")
     
@@ -43,14 +39,10 @@ async def thread_store_example():
     
     print()
 
-async def file_store_example():
+async def file_store_example(store: FileStore):
     """Demonstrate FileStore usage"""
     print("=== FileStore Example ===")
     
-    # Create a file store
-    store = await FileStore.create()
-    print("Created FileStore")
-    
     # Save a text file
     content = b"This is a sample text file content.\nIt contains multiple lines."
     metadata = await store.save(content, "sample.txt", "text/plain")
@@ -68,13 +60,10 @@ async def file_store_example():
     
     print()
 
-async def attachment_example():
+async def attachment_example(file_store: FileStore, thread_store: ThreadStore):
     """Demonstrate message attachments"""
     print("=== Attachment Example ===")
     
-    file_store = await FileStore.create()
-    thread_store = await ThreadStore.create()
-    
     # Create a message with an attachment
     message = Message(role="user", content="Here's a document for you to review")
     
@@ -115,12 +104,10 @@ async def attachment_example():
     
     print()
 
-async def platform_example():
+async def platform_example(store: ThreadStore):
     """Demonstrate platform integration"""
     print("=== Platform Integration Example ===")
     
-    store = await ThreadStore.create()
-    
     # Create a thread linked to a Slack conversation
     thread = Thread(
         title="Customer Support Ticket #123",
@@ -156,12 +143,12 @@ async def platform_example():
     await store.save(thread)
     print(f"Saved thread with platform data: {thread.platforms}")
     
-    # Find threads by platform
-    slack_threads = await store.find_by_platform("slack", {"channel": "C1234567890"})
+    # Find threads by platform and by attributes (independent lookups run concurrently)
+    slack_threads, high_priority = await asyncio.gather(
+        store.find_by_platform("slack", {"channel": "C1234567890"}),
+        store.find_by_attributes({"priority": "high"})
+    )
     print(f"Found {len(slack_threads)} threads in Slack channel")
-    
-    # Find threads by attributes
-    high_priority = await store.find_by_attributes({"priority": "high"})
     print(f"Found {len(high_priority)} high priority threads")
     
     print()
@@ -171,10 +158,19 @@ async def main():
     print("Tyler Stores Examples")
     print("=" * 50)
     
-    await thread_store_example()
-    await file_store_example()
-    await attachment_example()
-    await platform_example()
+    # Create the stores once, concurrently, and share them across the examples
+    thread_store, file_store = await asyncio.gather(
+        ThreadStore.create(),  # In-memory storage
+        FileStore.create()
+    )
+    print("Created in-memory ThreadStore and FileStore")
+    print()
+    
+    # Examples run one after another so their output stays readable
+    await thread_store_example(thread_store)
+    await file_store_example(file_store)
+    await attachment_example(file_store, thread_store)
+    await platform_example(thread_store)
     
     print("All examples completed successfully!")
 
@@ -1,25 +1,37 @@
 """Storage backend implementations for ThreadStore."""
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, UTC
 import json
 import os
 from pathlib import Path
 import tempfile
 import asyncio
-from sqlalchemy import create_engine, select, cast, String, text, bindparam
+from sqlalchemy import create_engine, select, cast, String, text, bindparam, literal, delete, insert
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import sessionmaker, selectinload
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 # Direct imports
 from ..models.thread import Thread
 from ..models.message import Message
-from ..models.attachment import Attachment
 from ..storage.file_store import FileStore
 from ..utils.logging import get_logger
 from .models import Base, ThreadRecord, MessageRecord
 
 logger = get_logger(__name__)
 
+# Dialect-specific INSERT constructs that support ON CONFLICT upserts
+_UPSERT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert
+}
+
+# Message fields that Message.model_dump(mode="python") copies over unchanged
+_DIRECT_MESSAGE_FIELDS = frozenset({
+    "id", "role", "sequence", "turn", "content", "timestamp", "name",
+    "tool_call_id", "source", "platforms", "metrics", "reactions", "attributes"
+})
+
 class StorageBackend(ABC):
     """Abstract base class for thread storage backends."""
     
@@ -33,6 +45,14 @@ class StorageBackend(ABC):
         """Save a thread to storage."""
         pass
     
+    async def save_many(self, threads: List[Thread]) -> List[Thread]:
+        """Save several threads to storage.
+        
+        Backends that support transactions should override this to save the
+        whole batch at once; by default each thread is saved in turn.
+        """
+        return [await self.save(thread) for thread in threads]
+    
     @abstractmethod
     async def get(self, thread_id: str) -> Optional[Thread]:
         """Get a thread by ID."""
@@ -43,6 +63,13 @@ class StorageBackend(ABC):
         """Delete a thread by ID."""
         pass
     
+    async def exists(self, thread_id: str) -> bool:
+        """Check whether a thread exists.
+        
+        Backends should override this with a check that doesn't load the thread.
+        """
+        return await self.get(thread_id) is not None
+    
     @abstractmethod
     async def list(self, limit: int = 100, offset: int = 0) -> List[Thread]:
         """List threads with pagination."""
@@ -79,6 +106,31 @@ class StorageBackend(ABC):
         """
         pass
 
+    def _message_values(self, message: Message, thread_id: str, sequence: int) -> Dict[str, Any]:
+        """Helper method to map a Message to messages table column values"""
+        return {
+            "id": message.id,
+            "thread_id": thread_id,
+            "sequence": sequence,
+            "turn": message.turn,
+            "role": message.role,
+            "content": message.content,
+            "name": message.name,
+            "tool_call_id": message.tool_call_id,
+            "tool_calls": message.tool_calls,
+            "attributes": message.attributes,
+            "timestamp": message.timestamp,
+            "source": message.source,
+            "platforms": message.platforms,
+            "attachments": [a.model_dump() for a in message.attachments] if message.attachments else None,
+            "metrics": message.metrics,
+            "reactions": message.reactions
+        }
+
+    def _create_message_record(self, message: Message, thread_id: str, sequence: int) -> MessageRecord:
+        """Helper method to create a MessageRecord from a Message"""
+        return MessageRecord(**self._message_values(message, thread_id, sequence))
+
 class MemoryBackend(StorageBackend):
     """In-memory storage backend using a dictionary."""
     
@@ -95,6 +147,9 @@ class MemoryBackend(StorageBackend):
     async def get(self, thread_id: str) -> Optional[Thread]:
         return self._threads.get(thread_id)
     
+    async def exists(self, thread_id: str) -> bool:
+        return thread_id in self._threads
+    
     async def delete(self, thread_id: str) -> bool:
         if thread_id in self._threads:
             del self._threads[thread_id]
@@ -140,24 +195,33 @@ class MemoryBackend(StorageBackend):
 
     async def find_messages_by_attribute(self, path: str, value: Any) -> List[MessageRecord]:
         """
-        Check if any messages exist with a specific attribute at a given JSON path.
+        Find messages that have a specific attribute at a given JSON path.
         
         Args:
             path: Dot-notation path to the attribute (e.g., "source.platform.attributes.ts")
             value: The value to search for
             
         Returns:
-            True if any messages match, False otherwise
+            List of messages matching the criteria (possibly empty)
         """
+        parts = path.split('.')
+        # Fields Message.model_dump passes through as-is can be read straight off
+        # the message; anything else goes through the serialized form
+        direct = parts[0] in _DIRECT_MESSAGE_FIELDS
+        
         # Traverse all threads and messages
+        matches = []
         for thread in self._threads.values():
             for message in thread.messages:
-                # Use the path to navigate to the target attribute
-                current = message.model_dump(mode="python")
+                if direct:
+                    current = getattr(message, parts[0])
+                    remaining = parts[1:]
+                else:
+                    current = message.model_dump(mode="python")
+                    remaining = parts
                 
                 # Navigate the nested structure
-                parts = path.split('.')
-                for part in parts:
+                for part in remaining:
                     if isinstance(current, dict) and part in current:
                         current = current[part]
                     else:
@@ -166,9 +230,9 @@ class MemoryBackend(StorageBackend):
                 
                 # Check if we found a match
                 if current == value:
-                    return [self._create_message_record(message, thread.id, 0)]
+                    matches.append(self._create_message_record(message, thread.id, message.sequence))
         
-        return []
+        return matches
 
 class SQLBackend(StorageBackend):
     """SQL storage backend supporting both SQLite and PostgreSQL with proper connection pooling."""
@@ -212,6 +276,8 @@ class SQLBackend(StorageBackend):
         self.engine = create_async_engine(self.database_url, **engine_kwargs)
         # Create session_maker for database operations
         self._session_maker = sessionmaker(self.engine, class_=AsyncSession, expire_on_commit=False)
+        # FileStore for attachment storage, created on first use
+        self._file_store: Optional[FileStore] = None
         
     @property
     def async_session(self):
@@ -231,7 +297,7 @@ class SQLBackend(StorageBackend):
 
     def _create_message_from_record(self, msg_record: MessageRecord) -> Message:
         """Helper method to create a Message from a MessageRecord"""
-        message = Message(
+        return Message.from_trusted(
             id=msg_record.id,
             role=msg_record.role,
             sequence=msg_record.sequence,
@@ -245,56 +311,43 @@ class SQLBackend(StorageBackend):
             source=msg_record.source,
             platforms=msg_record.platforms or {},
             metrics=msg_record.metrics,
-            reactions=msg_record.reactions or {}
+            reactions=msg_record.reactions or {},
+            attachments=msg_record.attachments or []
         )
-        if msg_record.attachments:
-            message.attachments = [Attachment(**a) for a in msg_record.attachments]
-        return message
 
     def _create_thread_from_record(self, record: ThreadRecord) -> Thread:
         """Helper method to create a Thread from a ThreadRecord"""
-        thread = Thread(
-            id=record.id,
-            title=record.title,
-            attributes=record.attributes,
-            platforms=record.platforms or {},
-            created_at=record.created_at,
-            updated_at=record.updated_at,
-            messages=[]
-        )
         # Sort messages: system messages first, then others by sequence
         sorted_messages = sorted(record.messages, 
             key=lambda m: (0 if m.role == "system" else 1, m.sequence or 0))
-        for msg_record in sorted_messages:
-            message = self._create_message_from_record(msg_record)
-            thread.messages.append(message)
-        return thread
+        # Stored rows were validated when saved, so skip re-validating them
+        return Thread.from_trusted({
+            "id": record.id,
+            "title": record.title,
+            "attributes": record.attributes,
+            "platforms": record.platforms or {},
+            "created_at": record.created_at,
+            "updated_at": record.updated_at,
+            "messages": [self._create_message_from_record(m) for m in sorted_messages]
+        })
 
-    def _create_message_record(self, message: Message, thread_id: str, sequence: int) -> MessageRecord:
-        """Helper method to create a MessageRecord from a Message"""
-        return MessageRecord(
-            id=message.id,
-            thread_id=thread_id,
-            sequence=sequence,
-            turn=message.turn,
-            role=message.role,
-            content=message.content,
-            name=message.name,
-            tool_call_id=message.tool_call_id,
-            tool_calls=message.tool_calls,
-            attributes=message.attributes,
-            timestamp=message.timestamp,
-            source=message.source,
-            platforms=message.platforms,
-            attachments=[a.model_dump() for a in message.attachments] if message.attachments else None,
-            metrics=message.metrics,
-            reactions=message.reactions
-        )
+    def _ordered_messages(self, thread: Thread) -> List[Tuple[Message, int]]:
+        """Pair a thread's messages with their stored sequence: system messages first at 0, then the rest from 1"""
+        ordered = [(message, 0) for message in thread.messages if message.role == "system"]
+        non_system = [message for message in thread.messages if message.role != "system"]
+        ordered.extend(zip(non_system, range(1, len(non_system) + 1)))
+        return ordered
     
     async def _get_session(self) -> AsyncSession:
         """Create and return a new session for database operations."""
         return self._session_maker()
 
+    def _get_file_store(self) -> FileStore:
+        """Return the FileStore used for attachments, creating it on first use."""
+        if self._file_store is None:
+            self._file_store = FileStore()
+        return self._file_store
+
     async def _cleanup_failed_attachments(self, thread: Thread) -> None:
         """Helper to clean up attachment files if thread save fails"""
         for message in thread.messages:
@@ -303,73 +356,129 @@ class SQLBackend(StorageBackend):
                     if hasattr(attachment, 'cleanup') and callable(attachment.cleanup):
                         await attachment.cleanup()
 
+    async def _store_attachments(self, thread: Thread) -> None:
+        """Process and store all attachments in a thread, cleaning up on failure"""
+        logger.info(f"Starting to process attachments for thread {thread.id}")
+        try:
+            attachments = []
+            for message in thread.messages:
+                if message.attachments:
+                    logger.info(f"Processing {len(message.attachments)} attachments for message {message.id}")
+                    attachments.extend(message.attachments)
+            # Attachments are independent of each other, so store them concurrently
+            if attachments:
+                file_store = self._get_file_store()
+                # Let every write finish before reporting a failure, so none is
+                # still changing its attachment after save has raised
+                results = await asyncio.gather(
+                    *(attachment.process_and_store(file_store) for attachment in attachments),
+                    return_exceptions=True
+                )
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
+                logger.info(f"Finished processing {len(attachments)} attachments for thread {thread.id}")
+        except Exception as e:
+            # Handle attachment processing failures
+            logger.error(f"Failed to process attachment: {str(e)}")
+            await self._cleanup_failed_attachments(thread)
+            raise RuntimeError(f"Failed to save thread: {str(e)}") from e
+
+    async def _build_thread_record(self, session: AsyncSession, thread: Thread) -> ThreadRecord:
+        """Load or create the ThreadRecord for a thread and fill it from the thread"""
+        # Get existing thread if it exists
+        stmt = select(ThreadRecord).options(selectinload(ThreadRecord.messages)).where(ThreadRecord.id == thread.id)
+        result = await session.execute(stmt)
+        thread_record = result.scalar_one_or_none()
+        
+        if thread_record:
+            # Update existing thread
+            thread_record.title = thread.title
+            thread_record.attributes = thread.attributes
+            thread_record.platforms = thread.platforms
+            thread_record.updated_at = datetime.now(UTC)
+            thread_record.messages = []  # Clear existing messages
+        else:
+            # Create new thread record
+            thread_record = ThreadRecord(
+                id=thread.id,
+                title=thread.title,
+                attributes=thread.attributes,
+                platforms=thread.platforms,
+                created_at=thread.created_at,
+                updated_at=thread.updated_at,
+                messages=[]
+            )
+        
+        # System messages first, then the rest in order
+        for message, sequence in self._ordered_messages(thread):
+            thread_record.messages.append(self._create_message_record(message, thread.id, sequence))
+        
+        return thread_record
+
+    async def _write_thread(self, session: AsyncSession, thread: Thread) -> None:
+        """Write a thread and replace its messages within the session's transaction
+        
+        On SQLite and PostgreSQL the thread and message rows are upserted with
+        INSERT ... ON CONFLICT, so no SELECT is needed first. Other databases go
+        through the ORM.
+        """
+        upsert_insert = _UPSERT_INSERTS.get(self.engine.dialect.name)
+        if upsert_insert is None:
+            session.add(await self._build_thread_record(session, thread))
+            return
+        
+        stmt = upsert_insert(ThreadRecord).values(
+            id=thread.id,
+            title=thread.title,
+            attributes=thread.attributes,
+            platforms=thread.platforms,
+            created_at=thread.created_at,
+            updated_at=thread.updated_at
+        )
+        await session.execute(stmt.on_conflict_do_update(
+            index_elements=[ThreadRecord.id],
+            set_={
+                "title": stmt.excluded.title,
+                "attributes": stmt.excluded.attributes,
+                "platforms": stmt.excluded.platforms,
+                "updated_at": datetime.now(UTC)
+            }
+        ))
+        
+        # Upsert the thread's current messages, then drop stored ones it no longer has.
+        # Upserting (rather than delete-and-reinsert) keeps concurrent saves of the
+        # same thread from colliding on message IDs the other transaction inserted.
+        rows = [self._message_values(message, thread.id, sequence) for message, sequence in self._ordered_messages(thread)]
+        if rows:
+            stmt = upsert_insert(MessageRecord)
+            await session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[MessageRecord.id],
+                    set_={column: stmt.excluded[column] for column in rows[0] if column != "id"}
+                ),
+                rows
+            )
+        await session.execute(
+            delete(MessageRecord).where(
+                MessageRecord.thread_id == thread.id,
+                MessageRecord.id.not_in([row["id"] for row in rows])
+            )
+        )
+
     async def save(self, thread: Thread) -> Thread:
         """Save a thread and its messages to the database."""
         session = await self._get_session()
         
-        # Create a FileStore instance for attachment storage
-        file_store = FileStore()
-        
         try:
             # Log the platforms data being saved
             logger.info(f"SQLBackend.save: Attempting to save thread {thread.id}. Platforms data: {json.dumps(thread.platforms if thread.platforms is not None else {})}")
             
             # First process and store all attachments
-            logger.info(f"Starting to process attachments for thread {thread.id}")
-            try:
-                for message in thread.messages:
-                    if message.attachments:
-                        logger.info(f"Processing {len(message.attachments)} attachments for message {message.id}")
-                        for attachment in message.attachments:
-                            logger.info(f"Processing attachment {attachment.filename} with status {attachment.status}")
-                            await attachment.process_and_store(file_store)
-                            logger.info(f"Finished processing attachment {attachment.filename}, new status: {attachment.status}")
-            except Exception as e:
-                # Handle attachment processing failures
-                logger.error(f"Failed to process attachment: {str(e)}")
-                await self._cleanup_failed_attachments(thread)
-                raise RuntimeError(f"Failed to save thread: {str(e)}") from e
+            await self._store_attachments(thread)
 
             async with session.begin():
-                # Get existing thread if it exists
-                stmt = select(ThreadRecord).options(selectinload(ThreadRecord.messages)).where(ThreadRecord.id == thread.id)
-                result = await session.execute(stmt)
-                thread_record = result.scalar_one_or_none()
-                
-                if thread_record:
-                    # Update existing thread
-                    thread_record.title = thread.title
-                    thread_record.attributes = thread.attributes
-                    thread_record.platforms = thread.platforms
-                    thread_record.updated_at = datetime.now(UTC)
-                    thread_record.messages = []  # Clear existing messages
-                else:
-                    # Create new thread record
-                    thread_record = ThreadRecord(
-                        id=thread.id,
-                        title=thread.title,
-                        attributes=thread.attributes,
-                        platforms=thread.platforms,
-                        created_at=thread.created_at,
-                        updated_at=thread.updated_at,
-                        messages=[]
-                    )
-                
-                # Process messages in order
-                sequence = 1
-                
-                # First handle system messages
-                for message in thread.messages:
-                    if message.role == "system":
-                        thread_record.messages.append(self._create_message_record(message, thread.id, 0))
-                
-                # Then handle non-system messages
-                for message in thread.messages:
-                    if message.role != "system":
-                        thread_record.messages.append(self._create_message_record(message, thread.id, sequence))
-                        sequence += 1
-                
-                session.add(thread_record)
+                await self._write_thread(session, thread)
                 try:
                     await session.commit()
                     logger.info(f"Thread {thread.id} successfully committed to database.")
@@ -387,6 +496,43 @@ class SQLBackend(StorageBackend):
         finally:
             await session.close()
 
+    async def save_many(self, threads: List[Thread]) -> List[Thread]:
+        """Save several threads and their messages in a single transaction."""
+        if not threads:
+            return []
+        session = await self._get_session()
+        
+        try:
+            # Store every thread's attachments concurrently before touching the database,
+            # letting them all finish before reporting a failure
+            results = await asyncio.gather(
+                *(self._store_attachments(thread) for thread in threads),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
+            async with session.begin():
+                for thread in threads:
+                    await self._write_thread(session, thread)
+                try:
+                    await session.commit()
+                    logger.info(f"{len(threads)} threads successfully committed to database.")
+                except Exception as e:
+                    # Convert database errors to RuntimeError for consistent error handling
+                    logger.error(f"Database error during commit: {str(e)}")
+                    raise RuntimeError(f"Failed to save threads: Database error - {str(e)}") from e
+                return threads
+                
+        except Exception as e:
+            # If this is not already a RuntimeError, wrap it
+            if not isinstance(e, RuntimeError):
+                raise RuntimeError(f"Failed to save threads: {str(e)}") from e
+            raise e
+        finally:
+            await session.close()
+
     async def get(self, thread_id: str) -> Optional[Thread]:
         """Get a thread by ID."""
         session = await self._get_session()
@@ -398,6 +544,15 @@ class SQLBackend(StorageBackend):
         finally:
             await session.close()
 
+    async def exists(self, thread_id: str) -> bool:
+        """Check whether a thread exists without loading it or its messages."""
+        session = await self._get_session()
+        try:
+            stmt = select(literal(1)).where(ThreadRecord.id == thread_id).limit(1)
+            return await session.scalar(stmt) is not None
+        finally:
+            await session.close()
+
     async def delete(self, thread_id: str) -> bool:
         """Delete a thread by ID."""
         session = await self._get_session()
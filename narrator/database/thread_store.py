@@ -124,7 +124,32 @@ class ThreadStore:
         """
         await self._ensure_initialized()
         
-        # Create a filtered copy of the thread without system messages
+        # Save the filtered thread to storage
+        await self._backend.save(self._without_system_messages(thread))
+        
+        # Return the original thread (with system messages intact)
+        return thread
+    
+    async def save_many(self, threads: List[Thread]) -> List[Thread]:
+        """
+        Save several threads to storage at once, filtering out system messages.
+        
+        The SQL backend writes the whole batch in a single transaction, which is
+        much faster than saving the threads one by one.
+        
+        Args:
+            threads: The Thread objects to save
+            
+        Returns:
+            The original Thread objects (with system messages intact)
+        """
+        await self._ensure_initialized()
+        await self._backend.save_many([self._without_system_messages(thread) for thread in threads])
+        return list(threads)
+    
+    @staticmethod
+    def _without_system_messages(thread: Thread) -> Thread:
+        """Create a copy of a thread without its system messages for storage"""
         filtered_thread = Thread(
             id=thread.id,
             title=thread.title,
@@ -140,17 +165,18 @@ class ThreadStore:
                 # We create a shallow copy of the message to preserve the original
                 filtered_thread.messages.append(message)
         
-        # Save the filtered thread to storage
-        await self._backend.save(filtered_thread)
-        
-        # Return the original thread (with system messages intact)
-        return thread
+        return filtered_thread
     
     async def get(self, thread_id: str) -> Optional[Thread]:
         """Get a thread by ID."""
         await self._ensure_initialized()
         return await self._backend.get(thread_id)
     
+    async def exists(self, thread_id: str) -> bool:
+        """Check whether a thread exists without loading it."""
+        await self._ensure_initialized()
+        return await self._backend.exists(thread_id)
+    
     async def delete(self, thread_id: str) -> bool:
         """Delete a thread by ID."""
         await self._ensure_initialized()
@@ -1,4 +1,5 @@
 from typing import Dict, Optional, Any, Union, Literal
+from functools import cached_property
 from pydantic import BaseModel, computed_field
 import base64
 import io
@@ -22,10 +23,23 @@ class Attachment(BaseModel):
     storage_backend: Optional[str] = None  # Storage backend type
     status: Literal["pending", "stored", "failed"] = "pending"
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Drop the cached id when any of its inputs change
+        if name in ("filename", "content", "mime_type"):
+            self.__dict__.pop("id", None)
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "Attachment":
+        copy = super().model_copy(update=update, deep=deep)
+        # update bypasses __setattr__, so drop the copied id if it changed an input
+        if update and update.keys() & {"filename", "content", "mime_type"}:
+            copy.__dict__.pop("id", None)
+        return copy
+
     @computed_field
-    @property
+    @cached_property
     def id(self) -> str:
-        """Generate a unique ID based on content hash"""
+        """Generate a unique ID based on content hash (computed once and cached)"""
         if self.content is None:
             # If no content, use filename and other attributes
             hash_input = f"{self.filename}{self.mime_type or ''}"
@@ -45,9 +59,10 @@ class Attachment(BaseModel):
             # Fallback to filename hash
             return hashlib.sha256(self.filename.encode()).hexdigest()[:16]
             
-        # Create hash of filename + content
-        hash_input = self.filename.encode() + content_bytes
-        return hashlib.sha256(hash_input).hexdigest()[:16]
+        # Hash filename + content incrementally to avoid copying the content
+        digest = hashlib.sha256(self.filename.encode())
+        digest.update(content_bytes)
+        return digest.hexdigest()[:16]
 
     @classmethod
     def from_file_path(cls, file_path: Union[str, Path]) -> 'Attachment':
@@ -71,6 +86,10 @@ class Attachment(BaseModel):
 
     def detect_mime_type(self) -> None:
         """Detect and set MIME type from content"""
+        if self.mime_type:
+            logger.debug("MIME type already set for %s: %s", self.filename, self.mime_type)
+            return
+
         if self.content is None:
             logger.warning(f"Cannot detect MIME type for {self.filename}: no content")
             return
@@ -88,13 +107,8 @@ class Attachment(BaseModel):
             return
         
         # Detect MIME type
-        detected_mime_type = magic.from_buffer(content_bytes, mime=True)
-        
-        if not self.mime_type:
-            self.mime_type = detected_mime_type
-            logger.debug(f"Detected MIME type for {self.filename}: {self.mime_type}")
-        else:
-            logger.debug(f"MIME type already set for {self.filename}: {self.mime_type}")
+        self.mime_type = magic.from_buffer(content_bytes, mime=True)
+        logger.debug("Detected MIME type for %s: %s", self.filename, self.mime_type)
 
     def model_dump(self, mode: str = "json") -> Dict[str, Any]:
         """Convert attachment to a dictionary suitable for JSON serialization
@@ -126,10 +140,10 @@ class Attachment(BaseModel):
             file_store: FileStore instance to use for retrieving file content.
                        Required when file_id is present.
         """
-        logger.debug(f"Getting content bytes for {self.filename}")
+        logger.debug("Getting content bytes for %s", self.filename)
         
         if self.file_id:
-            logger.debug(f"Retrieving content from file store for file_id: {self.file_id}")
+            logger.debug("Retrieving content from file store for file_id: %s", self.file_id)
             if file_store is None:
                 raise ValueError("FileStore instance required to retrieve content for file_id")
             if self.storage_path is None:
@@ -137,18 +151,18 @@ class Attachment(BaseModel):
             return await file_store.get(self.file_id, self.storage_path)
             
         if isinstance(self.content, bytes):
-            logger.debug(f"Content is already in bytes format for {self.filename}")
+            logger.debug("Content is already in bytes format for %s", self.filename)
             return self.content
         elif isinstance(self.content, str):
-            logger.debug(f"Converting string content for {self.filename}")
+            logger.debug("Converting string content for %s", self.filename)
             if self.content.startswith('data:'):
                 # Handle data URLs
                 logger.debug("Detected data URL format")
                 header, encoded = self.content.split(",", 1)
-                logger.debug(f"Data URL header: {header}")
+                logger.debug("Data URL header: %s", header)
                 try:
                     decoded = base64.b64decode(encoded)
-                    logger.debug(f"Successfully decoded data URL content, size: {len(decoded)} bytes")
+                    logger.debug("Successfully decoded data URL content, size: %s bytes", len(decoded))
                     return decoded
                 except Exception as e:
                     logger.error(f"Failed to decode data URL content: {e}")
@@ -158,7 +172,7 @@ class Attachment(BaseModel):
                     # Try base64 decode
                     logger.debug("Attempting base64 decode")
                     decoded = base64.b64decode(self.content)
-                    logger.debug(f"Successfully decoded base64 content, size: {len(decoded)} bytes")
+                    logger.debug("Successfully decoded base64 content, size: %s bytes", len(decoded))
                     return decoded
                 except:
                     logger.debug("Not base64, treating as UTF-8 text")
@@ -176,7 +190,7 @@ class Attachment(BaseModel):
             try:
                 # Get the file URL from FileStore
                 self.attributes["url"] = FileStore.get_file_url(self.storage_path)
-                logger.debug(f"Updated attributes with URL: {self.attributes['url']}")
+                logger.debug("Updated attributes with URL: %s", self.attributes['url'])
             except Exception as e:
                 # Log the error but don't fail - the URL will be missing but that's better than crashing
                 logger.error(f"Failed to construct URL for attachment: {e}")
@@ -189,8 +203,8 @@ class Attachment(BaseModel):
             file_store: FileStore instance to use for storing files
             force: Whether to force processing even if already stored
         """
-        logger.debug(f"Starting process_and_store for {self.filename} (force={force})")
-        logger.debug(f"Initial state - mime_type: {self.mime_type}, status: {self.status}, content type: {type(self.content)}")
+        logger.debug("Starting process_and_store for %s (force=%s)", self.filename, force)
+        logger.debug("Initial state - mime_type: %s, status: %s, content type: %s", self.mime_type, self.status, type(self.content))
         
         if not force and self.status == "stored":
             logger.info(f"Skipping process_and_store for {self.filename} - already stored")
@@ -205,16 +219,16 @@ class Attachment(BaseModel):
             # Get content as bytes first
             logger.debug("Converting content to bytes")
             content_bytes = await self.get_content_bytes(file_store=file_store)
-            logger.debug(f"Successfully converted content to bytes, size: {len(content_bytes)} bytes")
+            logger.debug("Successfully converted content to bytes, size: %s bytes", len(content_bytes))
 
             # Detect/verify MIME type
             logger.debug("Detecting MIME type")
             detected_mime_type = magic.from_buffer(content_bytes, mime=True)
-            logger.debug(f"Detected MIME type: {detected_mime_type}")
+            logger.debug("Detected MIME type: %s", detected_mime_type)
             
             if not self.mime_type:
                 self.mime_type = detected_mime_type
-                logger.debug(f"Set MIME type to detected type: {self.mime_type}")
+                logger.debug("Set MIME type to detected type: %s", self.mime_type)
             elif self.mime_type != detected_mime_type:
                 logger.warning(f"Provided MIME type {self.mime_type} doesn't match detected type {detected_mime_type}")
 
@@ -223,7 +237,7 @@ class Attachment(BaseModel):
                 self.attributes = {}
 
             # Process content based on MIME type
-            logger.debug(f"Processing content based on MIME type: {self.mime_type}")
+            logger.debug("Processing content based on MIME type: %s", self.mime_type)
             
             if self.mime_type.startswith('image/'):
                 logger.debug("Processing as image")
@@ -290,7 +304,7 @@ class Attachment(BaseModel):
                                 "encoding": encoding,
                                 "mime_type": self.mime_type
                             })
-                            logger.debug(f"Successfully decoded text using {encoding}")
+                            logger.debug("Successfully decoded text using %s", encoding)
                             break
                         except UnicodeDecodeError:
                             continue
@@ -316,7 +330,7 @@ class Attachment(BaseModel):
                     })
 
             else:
-                logger.debug(f"Processing as binary file with MIME type: {self.mime_type}")
+                logger.debug("Processing as binary file with MIME type: %s", self.mime_type)
                 self.attributes.update({
                     "type": "binary",
                     "description": f"Binary file {self.filename}",
@@ -327,9 +341,9 @@ class Attachment(BaseModel):
             logger.debug("Storing file in FileStore")
             
             try:
-                logger.debug(f"Saving file to storage, content size: {len(content_bytes)} bytes")
+                logger.debug("Saving file to storage, content size: %s bytes", len(content_bytes))
                 result = await file_store.save(content_bytes, self.filename, self.mime_type)
-                logger.debug(f"Successfully saved file. Result: {result}")
+                logger.debug("Successfully saved file. Result: %s", result)
                 
                 self.file_id = result['id']
                 self.storage_backend = result['storage_backend']
@@ -339,7 +353,7 @@ class Attachment(BaseModel):
                 # Update filename to match the one created by the file store
                 # Extract the actual filename from the storage path
                 new_filename = Path(self.storage_path).name
-                logger.debug(f"Updating attachment filename from {self.filename} to {new_filename}")
+                logger.debug("Updating attachment filename from %s to %s", self.filename, new_filename)
                 self.filename = new_filename
                 
                 # Add storage info to attributes
@@ -348,9 +362,9 @@ class Attachment(BaseModel):
                 
                 # Clear content after successful storage
                 self.content = None
-                logger.debug(f"Cleared content after successful storage for {self.filename}")
+                logger.debug("Cleared content after successful storage for %s", self.filename)
                 
-                logger.debug(f"Successfully processed and stored attachment {self.filename}")
+                logger.debug("Successfully processed and stored attachment %s", self.filename)
                 
             except Exception as e:
                 logger.error(f"Error processing attachment {self.filename}: {e}")
@@ -1,4 +1,4 @@
-from typing import Dict, Optional, Literal, Any, Union, List, TypedDict
+from typing import Dict, Optional, Literal, Any, Union, List, Tuple, TypedDict
 from datetime import datetime, UTC
 from pydantic import BaseModel, Field, field_validator, model_validator
 import hashlib
@@ -141,25 +141,68 @@ class Message(BaseModel):
         
         super().__init__(**data)
         if not self.id:
-            # Create a hash of relevant properties
-            hash_content = {
-                "role": self.role,
-                "sequence": self.sequence,  # Include sequence in hash
-                "turn": self.turn,  # Include turn in hash
-                "content": self.content,
-                "timestamp": self.timestamp.isoformat()
-            }
-            # Include name for function messages
-            if self.name and self.role == "tool":
-                hash_content["name"] = self.name
-                
-            if self.source:
-                hash_content["source"] = self.source
+            self.id = self._generate_id()
+
+    @classmethod
+    def from_trusted(cls, **data) -> "Message":
+        """Build a message from data that is already known to be valid
+        
+        For reloading stored messages: validation and ID generation are skipped,
+        so data must include the id, and attachments must be Attachment objects
+        or attachment dicts. A naive timestamp is still treated as UTC. Use the
+        normal constructor for anything else.
+        """
+        timestamp = data.get("timestamp")
+        if timestamp is not None and timestamp.tzinfo is None:
+            data["timestamp"] = timestamp.replace(tzinfo=UTC)
+        attachments = data.get("attachments")
+        if attachments:
+            data["attachments"] = [a if isinstance(a, Attachment) else Attachment(**a) for a in attachments]
+        # Copy mutable containers as validation would, so the message never shares
+        # them with the source data (e.g. another message's model_dump output)
+        for key in ("attributes", "metrics", "source"):
+            if data.get(key) is not None:
+                data[key] = dict(data[key])
+        for key in ("platforms", "reactions"):
+            if data.get(key) is not None:
+                data[key] = {k: v.copy() for k, v in data[key].items()}
+        for key in ("content", "tool_calls"):
+            if isinstance(data.get(key), list):
+                data[key] = list(data[key])
+        return cls.model_construct(**data)
+
+    def _generate_id(self) -> str:
+        """Generate a deterministic ID from the message's identifying fields"""
+        # Create a hash of relevant properties
+        hash_content = {
+            "role": self.role,
+            "sequence": self.sequence,  # Include sequence in hash
+            "turn": self.turn,  # Include turn in hash
+            "content": self.content,
+            "timestamp": self.timestamp.isoformat()
+        }
+        # Include name for function messages
+        if self.name and self.role == "tool":
+            hash_content["name"] = self.name
             
-            # Create deterministic JSON string for hashing
-            hash_str = json.dumps(hash_content, sort_keys=True)
-            self.id = hashlib.sha256(hash_str.encode()).hexdigest()
-            logger.debug(f"Generated message ID {self.id} from hash content: {hash_str}")
+        if self.source:
+            hash_content["source"] = self.source
+        
+        # Create deterministic JSON string for hashing
+        hash_str = json.dumps(hash_content, sort_keys=True)
+        message_id = hashlib.sha256(hash_str.encode()).hexdigest()
+        logger.debug("Generated message ID %s from hash content: %s", message_id, hash_str)
+        return message_id
+
+    def _set_position(self, sequence: int, turn: Optional[int]) -> None:
+        """Set sequence and turn without re-running assignment validation
+        
+        For Thread, which computes both values itself. A plain assignment would
+        re-run every model validator because of validate_assignment.
+        """
+        self.__dict__["sequence"] = sequence
+        self.__dict__["turn"] = turn
+        self.__pydantic_fields_set__.update(("sequence", "turn"))
 
     def _serialize_tool_calls(self, tool_calls):
         """Helper method to serialize tool calls into a JSON-friendly format"""
@@ -362,18 +405,34 @@ class Message(BaseModel):
         Returns:
             True if reaction was added, False if it already existed
         """
-        logger.info(f"Message.add_reaction (msg_id={self.id}): Current reactions: {self.reactions}. Adding '{emoji}' for user '{user_id}'.")
-        if emoji not in self.reactions:
-            self.reactions[emoji] = []
-        
-        if user_id in self.reactions[emoji]:
-            logger.warning(f"Message.add_reaction (msg_id={self.id}): User '{user_id}' already reacted with '{emoji}'.")
+        logger.info("Message.add_reaction (msg_id=%s): Current reactions: %s. Adding '%s' for user '%s'.", self.id, self.reactions, emoji, user_id)
+        users = self.reactions.setdefault(emoji, [])
+        if user_id in users:
+            logger.warning("Message.add_reaction (msg_id=%s): User '%s' already reacted with '%s'.", self.id, user_id, emoji)
             return False # Indicate that reaction was not newly added because it already existed
         
-        self.reactions[emoji].append(user_id)
-        logger.info(f"Message.add_reaction (msg_id={self.id}): Successfully added. Reactions now: {self.reactions}")
+        users.append(user_id)
+        logger.info("Message.add_reaction (msg_id=%s): Successfully added. Reactions now: %s", self.id, self.reactions)
         return True
 
+    def add_reactions(self, reactions: List[Tuple[str, str]]) -> int:
+        """Add several reactions to a message in one call.
+        
+        Args:
+            reactions: List of (emoji, user_id) pairs
+            
+        Returns:
+            Number of reactions added; pairs that already existed are skipped
+        """
+        added = 0
+        for emoji, user_id in reactions:
+            users = self.reactions.setdefault(emoji, [])
+            if user_id not in users:
+                users.append(user_id)
+                added += 1
+        logger.info("Message.add_reactions (msg_id=%s): Added %d of %d reactions. Reactions now: %s", self.id, added, len(reactions), self.reactions)
+        return added
+
     def remove_reaction(self, emoji: str, user_id: str) -> bool:
         """Remove a reaction from a message.
         
@@ -384,18 +443,19 @@ class Message(BaseModel):
         Returns:
             True if reaction was removed, False if it didn't exist
         """
-        logger.info(f"Message.remove_reaction (msg_id={self.id}): Current reactions: {self.reactions}. Removing '{emoji}' for user '{user_id}'.")
-        if emoji not in self.reactions or user_id not in self.reactions[emoji]:
-            logger.warning(f"Message.remove_reaction (msg_id={self.id}): Emoji '{emoji}' or user '{user_id}' not found in reactions {self.reactions}.")
+        logger.info("Message.remove_reaction (msg_id=%s): Current reactions: %s. Removing '%s' for user '%s'.", self.id, self.reactions, emoji, user_id)
+        users = self.reactions.get(emoji)
+        if not users or user_id not in users:
+            logger.warning("Message.remove_reaction (msg_id=%s): Emoji '%s' or user '%s' not found in reactions %s.", self.id, emoji, user_id, self.reactions)
             return False
         
-        self.reactions[emoji].remove(user_id)
+        users.remove(user_id)
         
         # Clean up empty reactions
-        if not self.reactions[emoji]:
+        if not users:
             del self.reactions[emoji]
             
-        logger.info(f"Message.remove_reaction (msg_id={self.id}): Successfully removed. Reactions now: {self.reactions}")
+        logger.info("Message.remove_reaction (msg_id=%s): Successfully removed. Reactions now: %s", self.id, self.reactions)
         return True
 
     def get_reactions(self) -> Dict[str, List[str]]:
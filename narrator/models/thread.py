@@ -1,6 +1,6 @@
-from typing import List, Dict, Optional, Literal, Any
+from typing import List, Dict, Optional, Literal, Any, Tuple
 from datetime import datetime, UTC
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from narrator.models.message import Message
 from narrator.storage.file_store import FileStore
 import uuid
@@ -8,18 +8,63 @@ from narrator.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+_TOKEN_KEYS = ("completion_tokens", "prompt_tokens", "total_tokens")
+
+# Bound once; thread mutators stamp updated_at on every call
+_now = datetime.now
+
+class _MessageIndex:
+    """Position lookups derived from a thread's messages
+    
+    The index is brought up to date lazily by sync(): messages appended to the
+    list since the last sync are folded in, and anything else (the list being
+    replaced or shrinking) triggers a full rebuild. Thread methods that change
+    the list in other ways call invalidate(). Callers check every position
+    against the list before using it, since in-place edits can leave it stale.
+    """
+    
+    def __init__(self):
+        self._reset(None)
+    
+    def _reset(self, messages: Optional[List[Message]]) -> None:
+        self._messages = messages  # List the index was built from
+        self._count = 0  # Number of messages from that list already indexed
+        self.positions: Dict[str, int] = {}  # Message ID -> position of first message with that ID
+    
+    def __eq__(self, other: Any) -> bool:
+        # Derived state only, so it never makes two threads unequal
+        return isinstance(other, _MessageIndex)
+    
+    def invalidate(self) -> None:
+        """Force a full rebuild on the next sync"""
+        self._messages = None
+    
+    def sync(self, messages: List[Message]) -> "_MessageIndex":
+        """Bring the index up to date with messages and return it"""
+        if messages is not self._messages or len(messages) < self._count:
+            self._reset(messages)
+        for position in range(self._count, len(messages)):
+            self._add(position, messages[position])
+        self._count = len(messages)
+        return self
+    
+    def _add(self, position: int, message: Message) -> None:
+        """Fold a single message into the index"""
+        self.positions.setdefault(message.id, position)
+
 class Thread(BaseModel):
     """Represents a thread containing multiple messages"""
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     title: Optional[str] = Field(default="Untitled Thread")
     messages: List[Message] = Field(default_factory=list)
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = Field(default_factory=lambda: _now(UTC))
+    updated_at: datetime = Field(default_factory=lambda: _now(UTC))
     attributes: Dict = Field(default_factory=dict)
     platforms: Dict[str, Dict[str, str]] = Field(
         default_factory=dict,
         description="References to where this thread exists on external platforms. Maps platform name to platform-specific identifiers."
     )
+    _index: _MessageIndex = PrivateAttr(default_factory=_MessageIndex)
     
     model_config = {
         "json_schema_extra": {
@@ -49,6 +94,29 @@ class Thread(BaseModel):
             return value.replace(tzinfo=UTC)
         return value
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "Thread":
+        """Build a thread from data that is already known to be valid
+        
+        For reloading stored threads, e.g. the output of model_dump(mode="python"):
+        validation is skipped for the thread and its messages (see
+        Message.from_trusted). Naive datetimes are still treated as UTC.
+        Use model_validate for untrusted input.
+        """
+        data = dict(data)
+        data["messages"] = [
+            message if isinstance(message, Message) else Message.from_trusted(**message)
+            for message in data.get("messages", [])
+        ]
+        for key in ("attributes", "platforms"):
+            if data.get(key) is not None:
+                data[key] = dict(data[key])
+        for key in ("created_at", "updated_at"):
+            value = data.get(key)
+            if value is not None and value.tzinfo is None:
+                data[key] = value.replace(tzinfo=UTC)
+        return cls.model_construct(**data)
+
     def model_dump(self, mode: str = "json") -> Dict[str, Any]:
         """Convert thread to a dictionary suitable for JSON serialization
         
@@ -76,33 +144,23 @@ class Thread(BaseModel):
         """
         # Set message sequence - system messages always get 0, others get next available number starting at 1
         if message.role == "system":
-            message.sequence = 0
-            message.turn = 0  # System messages always get turn 0
+            message._set_position(0, 0)  # System messages always get turn 0
             # Insert at beginning to maintain system message first
             self.messages.insert(0, message)
+            self._index.invalidate()
         else:
-            # Find highest sequence number and increment
-            max_sequence = max((m.sequence for m in self.messages if m.role != "system"), default=0)
-            message.sequence = max_sequence + 1
-            self.messages.append(message)
-        
-        # Handle turn assignment for non-system messages
-        if message.role != "system":
-            if same_turn and self.messages and len(self.messages) > 1:
-                # Use same turn as last message (excluding the one we just added)
-                last_message = self.messages[-2]  # Get second-to-last since we just appended
+            # Next turn number, counting a turn the message may already carry
+            max_sequence, max_turn = self._max_positions()
+            turn = max(max_turn, message.turn if message.turn is not None else 0) + 1
+            if same_turn and self.messages:
+                # Use same turn as last message, unless that was a system message
+                last_message = self.messages[-1]
                 if last_message.role != "system":
-                    message.turn = last_message.turn
-                else:
-                    # If last message was system, get next turn
-                    max_turn = max((m.turn for m in self.messages if m.turn is not None and m.role != "system"), default=0)
-                    message.turn = max_turn + 1
-            else:
-                # Get next turn number
-                max_turn = max((m.turn for m in self.messages if m.turn is not None and m.role != "system"), default=0)
-                message.turn = max_turn + 1
+                    turn = last_message.turn
+            message._set_position(max_sequence + 1, turn)
+            self.messages.append(message)
         
-        self.updated_at = datetime.now(UTC)
+        self.updated_at = _now(UTC)
 
     def add_messages_batch(self, messages: List[Message]) -> None:
         """Add multiple messages as a batch (all get the same turn number)
@@ -113,25 +171,36 @@ class Thread(BaseModel):
         if not messages:
             return
         
-        # Get the next turn number for all messages in the batch
-        max_turn = max((m.turn for m in self.messages if m.turn is not None and m.role != "system"), default=0)
+        # Get the next turn and sequence numbers once for the whole batch
+        sequence, max_turn = self._max_positions()
         batch_turn = max_turn + 1
-        
-        # Add each message with the same turn number
-        for i, message in enumerate(messages):
+
+        # Number the batch locally and append it in a single extend
+        appended = []
+        for message in messages:
             if message.role == "system":
                 # System messages handled separately
-                message.sequence = 0
-                message.turn = 0
+                message._set_position(0, 0)
                 self.messages.insert(0, message)
+                self._index.invalidate()
             else:
-                # Set sequence and turn for non-system messages
-                max_sequence = max((m.sequence for m in self.messages if m.role != "system"), default=0)
-                message.sequence = max_sequence + 1
-                message.turn = batch_turn
-                self.messages.append(message)
-        
-        self.updated_at = datetime.now(UTC)
+                sequence += 1
+                message._set_position(sequence, batch_turn)
+                appended.append(message)
+        self.messages.extend(appended)
+
+        self.updated_at = _now(UTC)
+
+    def _max_positions(self) -> Tuple[int, int]:
+        """Return the highest sequence and turn among non-system messages, in one pass"""
+        max_sequence = max_turn = 0
+        for m in self.messages:
+            if m.role != "system":
+                if m.sequence is not None and m.sequence > max_sequence:
+                    max_sequence = m.sequence
+                if m.turn is not None and m.turn > max_turn:
+                    max_turn = m.turn
+        return max_sequence, max_turn
 
     async def get_messages_for_chat_completion(self, file_store: Optional[FileStore] = None) -> List[Dict[str, Any]]:
         """Return messages in the format expected by chat completion APIs
@@ -142,12 +211,17 @@ class Thread(BaseModel):
             file_store: Optional FileStore instance to pass to messages for file URL access
         """
         # Only include non-system messages from the thread - system messages are injected by agents
-        return [msg.to_chat_completion_message(file_store=file_store) for msg in self.messages if msg.role != "system"]
+        return [msg.to_chat_completion_message(file_store=file_store) for msg in self.non_system_messages]
+
+    @property
+    def non_system_messages(self) -> List[Message]:
+        """Messages other than system messages, in list order"""
+        return [m for m in self.messages if m.role != "system"]
 
     def clear_messages(self) -> None:
         """Clear all messages from the thread"""
         self.messages = []
-        self.updated_at = datetime.now(UTC)
+        self.updated_at = _now(UTC)
 
     def get_last_message_by_role(self, role: Literal["user", "assistant", "system", "tool"]) -> Optional[Message]:
         """Return the last message with the specified role, or None if no messages exist with that role"""
@@ -169,56 +243,53 @@ class Thread(BaseModel):
                 if len(first_content) > 50:
                     title += "..."
                 self.title = title
-                self.updated_at = datetime.now(UTC)
+                self.updated_at = _now(UTC)
                 return title
         
         return "Untitled Thread"
 
-    def get_total_tokens(self) -> Dict[str, Any]:
-        """Get total token usage across all messages in the thread
-        
-        Returns:
-            Dictionary containing:
-            - overall: Total token counts across all models
-            - by_model: Token counts broken down by model
-        """
-        overall = {
-            "completion_tokens": 0,
-            "prompt_tokens": 0,
-            "total_tokens": 0
-        }
-        
+    def _usage_totals(self) -> Tuple[Dict[str, int], Dict[str, Dict[str, int]]]:
+        """Return overall token counts and per-model call and token counts, in one pass"""
+        overall = dict.fromkeys(_TOKEN_KEYS, 0)
         by_model = {}
         
         for message in self.messages:
             metrics = message.metrics
             if not metrics:
                 continue
-                
-            # Update overall counts
-            if "usage" in metrics:
-                overall["completion_tokens"] += metrics["usage"].get("completion_tokens", 0)
-                overall["prompt_tokens"] += metrics["usage"].get("prompt_tokens", 0)
-                overall["total_tokens"] += metrics["usage"].get("total_tokens", 0)
             
-            # Update per-model counts
+            usage = metrics.get("usage")
+            if usage is not None:
+                for key in _TOKEN_KEYS:
+                    overall[key] += usage.get(key, 0)
+            
             model = metrics.get("model")
             if model:
-                if model not in by_model:
-                    by_model[model] = {
-                        "completion_tokens": 0,
-                        "prompt_tokens": 0,
-                        "total_tokens": 0
-                    }
-                
-                if "usage" in metrics:
-                    by_model[model]["completion_tokens"] += metrics["usage"].get("completion_tokens", 0)
-                    by_model[model]["prompt_tokens"] += metrics["usage"].get("prompt_tokens", 0)
-                    by_model[model]["total_tokens"] += metrics["usage"].get("total_tokens", 0)
-            
+                model_usage = by_model.get(model)
+                if model_usage is None:
+                    model_usage = by_model[model] = {"calls": 0, **dict.fromkeys(_TOKEN_KEYS, 0)}
+                model_usage["calls"] += 1
+                if usage is not None:
+                    for key in _TOKEN_KEYS:
+                        model_usage[key] += usage.get(key, 0)
+        
+        return overall, by_model
+
+    def get_total_tokens(self) -> Dict[str, Any]:
+        """Get total token usage across all messages in the thread
+        
+        Returns:
+            Dictionary containing:
+            - overall: Total token counts across all models
+            - by_model: Token counts broken down by model
+        """
+        overall, by_model = self._usage_totals()
         return {
             "overall": overall,
-            "by_model": by_model
+            "by_model": {
+                model: {key: usage[key] for key in _TOKEN_KEYS}
+                for model, usage in by_model.items()
+            }
         }
 
     def get_model_usage(self, model_name: Optional[str] = None) -> Dict[str, Any]:
@@ -230,27 +301,7 @@ class Thread(BaseModel):
         Returns:
             Dictionary containing model usage statistics
         """
-        model_usage = {}
-        
-        for message in self.messages:
-            metrics = message.metrics
-            if not metrics or not metrics.get("model"):
-                continue
-                
-            model = metrics["model"]
-            if model not in model_usage:
-                model_usage[model] = {
-                    "calls": 0,
-                    "completion_tokens": 0,
-                    "prompt_tokens": 0,
-                    "total_tokens": 0
-                }
-            
-            model_usage[model]["calls"] += 1
-            if "usage" in metrics:
-                model_usage[model]["completion_tokens"] += metrics["usage"].get("completion_tokens", 0)
-                model_usage[model]["prompt_tokens"] += metrics["usage"].get("prompt_tokens", 0)
-                model_usage[model]["total_tokens"] += metrics["usage"].get("total_tokens", 0)
+        model_usage = self._usage_totals()[1]
         
         if model_name:
             return model_usage.get(model_name, {
@@ -275,8 +326,9 @@ class Thread(BaseModel):
         message_count = 0
         
         for message in self.messages:
-            if message.metrics and message.metrics.get("timing", {}).get("latency"):
-                total_latency += message.metrics["timing"]["latency"]
+            latency = message.metrics.get("timing", {}).get("latency") if message.metrics else None
+            if latency:
+                total_latency += latency
                 message_count += 1
         
         return {
@@ -291,16 +343,9 @@ class Thread(BaseModel):
         Returns:
             Dictionary with counts for each role (system, user, assistant, tool)
         """
-        counts = {
-            "system": 0,
-            "user": 0,
-            "assistant": 0,
-            "tool": 0
-        }
-        
+        counts = dict.fromkeys(("system", "user", "assistant", "tool"), 0)
         for message in self.messages:
             counts[message.role] += 1
-            
         return counts
 
     def get_tool_usage(self) -> Dict[str, Any]:
@@ -332,10 +377,7 @@ class Thread(BaseModel):
 
     def get_system_message(self) -> Optional[Message]:
         """Get the system message from the thread if it exists"""
-        for message in self.messages:
-            if message.role == "system":
-                return message
-        return None
+        return next((m for m in self.messages if m.role == "system"), None)
 
     def get_messages_in_sequence(self) -> List[Message]:
         """Get messages sorted by sequence number"""
@@ -359,15 +401,8 @@ class Thread(BaseModel):
         Returns:
             Current turn number, or 0 if no messages
         """
-        if not self.messages:
-            return 0
-        
-        # Exclude system messages when determining current turn
-        non_system_messages = [m for m in self.messages if m.role != "system"]
-        if not non_system_messages:
-            return 0
-            
-        return max(m.turn for m in non_system_messages if m.turn is not None)
+        # System messages are excluded when determining current turn
+        return self._max_positions()[1]
 
     def get_turns_summary(self) -> Dict[int, Dict[str, Any]]:
         """Get a summary of all turns in the thread
@@ -404,8 +439,14 @@ class Thread(BaseModel):
 
     def get_message_by_id(self, message_id: str) -> Optional[Message]:
         """Return the message with the specified ID, or None if no message exists with that ID"""
+        position = self._index.sync(self.messages).positions.get(message_id)
+        if position is not None and position < len(self.messages) and self.messages[position].id == message_id:
+            return self.messages[position]
+        
+        # Miss or stale entry (the list or an ID was changed in place) - fall back to a scan
         for message in self.messages:
             if message.id == message_id:
+                self._index.invalidate()
                 return message
         return None
 
@@ -422,15 +463,35 @@ class Thread(BaseModel):
         """
         message = self.get_message_by_id(message_id)
         if not message:
-            logger.warning(f"Thread.add_reaction (thread_id={self.id}): Message with ID '{message_id}' not found.")
+            logger.warning("Thread.add_reaction (thread_id=%s): Message with ID '%s' not found.", self.id, message_id)
             return False
         
         result = message.add_reaction(emoji, user_id)
         if result:
-            self.updated_at = datetime.now(UTC) # Ensure thread update time is changed
-            logger.info(f"Thread.add_reaction (thread_id={self.id}): Message '{message_id}' reactions updated. Thread updated_at: {self.updated_at}")
+            self.updated_at = _now(UTC) # Ensure thread update time is changed
+            logger.info("Thread.add_reaction (thread_id=%s): Message '%s' reactions updated. Thread updated_at: %s", self.id, message_id, self.updated_at)
         return result
     
+    def add_reactions(self, message_id: str, reactions: List[Tuple[str, str]]) -> int:
+        """Add several reactions to a message in the thread in one call
+        
+        Args:
+            message_id: ID of the message to react to
+            reactions: List of (emoji, user_id) pairs
+            
+        Returns:
+            Number of reactions added (0 if the message wasn't found)
+        """
+        message = self.get_message_by_id(message_id)
+        if not message:
+            logger.warning("Thread.add_reactions (thread_id=%s): Message with ID '%s' not found.", self.id, message_id)
+            return 0
+        
+        added = message.add_reactions(reactions)
+        if added:
+            self.updated_at = _now(UTC) # Ensure thread update time is changed
+        return added
+    
     def remove_reaction(self, message_id: str, emoji: str, user_id: str) -> bool:
         """Remove a reaction from a message in the thread
         
@@ -444,13 +505,13 @@ class Thread(BaseModel):
         """
         message = self.get_message_by_id(message_id)
         if not message:
-            logger.warning(f"Thread.remove_reaction (thread_id={self.id}): Message with ID '{message_id}' not found.")
+            logger.warning("Thread.remove_reaction (thread_id=%s): Message with ID '%s' not found.", self.id, message_id)
             return False
             
         result = message.remove_reaction(emoji, user_id)
         if result:
-            self.updated_at = datetime.now(UTC) # Ensure thread update time is changed
-            logger.info(f"Thread.remove_reaction (thread_id={self.id}): Message '{message_id}' reactions updated. Thread updated_at: {self.updated_at}")
+            self.updated_at = _now(UTC) # Ensure thread update time is changed
+            logger.info("Thread.remove_reaction (thread_id=%s): Message '%s' reactions updated. Thread updated_at: %s", self.id, message_id, self.updated_at)
         return result
     
     def get_reactions(self, message_id: str) -> Dict[str, List[str]]:
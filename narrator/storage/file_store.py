@@ -8,6 +8,7 @@ import shutil
 import hashlib
 import asyncio
 import mimetypes
+import posixpath
 from datetime import datetime, UTC
 from sqlalchemy import select
 from ..utils.logging import get_logger
@@ -17,6 +18,30 @@ import base64
 # Get configured logger
 logger = get_logger(__name__)
 
+# Files up to this size are read/written inline; dispatching to a worker
+# thread costs more than the I/O itself
+INLINE_IO_THRESHOLD = 64 * 1024
+
+# Extension -> MIME type table, built once from the mimetypes registry
+mimetypes.init()
+_EXT_TO_MIME: Dict[str, str] = dict(mimetypes.types_map)
+# Suffixes that mimetypes.guess_type strips or rewrites before the table lookup
+# (.gz, .tgz, ...), so files ending in them need the full lookup
+_REWRITTEN_SUFFIXES = frozenset(mimetypes.suffix_map) | frozenset(mimetypes.encodings_map)
+
+def _guess_mime_type(filename: str) -> Optional[str]:
+    """Guess a MIME type from the filename extension, as mimetypes.guess_type would"""
+    # Same split guess_type uses, so a leading dot (".env") is not an extension
+    ext = posixpath.splitext(filename)[1]
+    if ext and ext not in _REWRITTEN_SUFFIXES:
+        lower = ext.lower()
+        if lower not in _REWRITTEN_SUFFIXES:
+            mime_type = _EXT_TO_MIME.get(lower)
+            if mime_type:
+                return mime_type
+    # Compound and encoding suffixes like .tar.gz, and anything not in the table
+    return mimetypes.guess_type(filename)[0]
+
 class FileStoreError(Exception):
     """Base exception for file store errors"""
     pass
@@ -96,6 +121,9 @@ class FileStore:
         'audio/flac',
         'audio/x-m4a',
     }
+
+    # Base paths that have already passed the create() storage probe in this process
+    _validated_paths: Set[Path] = set()
     
     @classmethod
     async def create(cls, base_path: Optional[str] = None, max_file_size: Optional[int] = None, 
@@ -104,8 +132,10 @@ class FileStore:
         Factory method to create and validate a FileStore instance.
         
         This method validates storage configuration immediately, allowing
-        early detection of storage access issues.
-        
+        early detection of storage access issues. The full probe runs once per
+        base path per process; later calls for the same path only check that
+        the directory still exists and is readable and writable.
+
         Args:
             base_path: Base directory for file storage
             max_file_size: Maximum allowed file size in bytes
@@ -121,6 +151,13 @@ class FileStore:
         # Create instance 
         store = cls(base_path, max_file_size, allowed_mime_types, max_storage_size)
         
+        # Skip the probe if this location was already validated and is still usable
+        if store.base_path in cls._validated_paths:
+            if store.base_path.is_dir() and os.access(store.base_path, os.R_OK | os.W_OK):
+                logger.debug("Storage at %s already validated, skipping probe", store.base_path)
+                return store
+            cls._validated_paths.discard(store.base_path)
+        
         try:
             # Validate storage by writing and reading a test file
             test_id = str(uuid.uuid4())
@@ -137,8 +174,9 @@ class FileStore:
                 
             # Check that we can create storage stats
             storage_size = await store.get_storage_size()
-            logger.debug(f"Storage validation successful. Current storage size: {storage_size} bytes")
+            logger.debug("Storage validation successful. Current storage size: %s bytes", storage_size)
             
+            cls._validated_paths.add(store.base_path)
             return store
         except Exception as e:
             logger.error(f"Storage validation failed: {e}")
@@ -282,17 +320,23 @@ class FileStore:
 
         # Detect or validate MIME type
         if not mime_type:
-            mime_type = mimetypes.guess_type(filename)[0]
+            mime_type = _guess_mime_type(filename)
             if not mime_type:
                 # Try to detect from content
                 mime_type = magic.from_buffer(content, mime=True)
-                logger.debug(f"Detected MIME type for {filename}: {mime_type}")
+                logger.debug("Detected MIME type for %s: %s", filename, mime_type)
 
         if mime_type not in self.allowed_mime_types:
             raise UnsupportedFileTypeError(f"Unsupported file type: {mime_type}")
 
         return mime_type
 
+    @staticmethod
+    def _write_file(file_path: Path, content: bytes) -> None:
+        """Write content to file_path, creating its shard directory if needed"""
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(content)
+
     def _get_file_path(self, file_id: str, extension: Optional[str] = None) -> Path:
         """Get full path for file ID using sharded directory structure"""
         # Use first 2 chars of ID as subdirectory to avoid too many files in one dir
@@ -323,10 +367,12 @@ class FileStore:
         
         # Get sharded path with extension
         file_path = self._get_file_path(file_id, extension)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Write content
-        file_path.write_bytes(content)
+        # Write content, off the event loop unless it is small
+        if len(content) <= INLINE_IO_THRESHOLD:
+            self._write_file(file_path, content)
+        else:
+            await asyncio.to_thread(self._write_file, file_path, content)
         
         metadata = {
             'id': file_id,
@@ -340,8 +386,8 @@ class FileStore:
             }
         }
         
-        logger.debug(f"Saved file {filename} ({len(content)} bytes) to {file_path}")
-        logger.debug(f"Successfully stored attachment {filename} with MIME type {mime_type}")
+        logger.debug("Saved file %s (%s bytes) to %s", filename, len(content), file_path)
+        logger.debug("Successfully stored attachment %s with MIME type %s", filename, mime_type)
         return metadata
     
     async def get(self, file_id: str, storage_path: Optional[str] = None) -> bytes:
@@ -364,10 +410,15 @@ class FileStore:
             # Fallback to constructing path from ID (legacy support)
             file_path = self._get_file_path(file_id)
             
-        if not file_path.exists():
+        try:
+            size = file_path.stat().st_size
+        except OSError:
             raise FileNotFoundError(f"File {file_id} not found at {file_path}")
             
-        return file_path.read_bytes()
+        # Read content, off the event loop unless it is small
+        if size <= INLINE_IO_THRESHOLD:
+            return file_path.read_bytes()
+        return await asyncio.to_thread(file_path.read_bytes)
     
     async def delete(self, file_id: str, storage_path: Optional[str] = None) -> None:
         """Delete file from storage
@@ -1,5 +1,6 @@
 import os
 import sys
+import tempfile
 import pytest
 import pytest_asyncio
 from unittest.mock import patch, MagicMock
@@ -8,9 +9,19 @@ from unittest.mock import patch, MagicMock
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
-@pytest.fixture(autouse=True)
+# Import the package once here so every test module finds it already loaded
+from narrator import Thread, Message, Attachment, ThreadStore, FileStore
+
+def pytest_configure(config):
+    """Register custom markers"""
+    config.addinivalue_line("markers", "unit: fast model-level tests with no I/O (select with '-m unit')")
+
+@pytest.fixture(autouse=True, scope="session")
 def mock_env_vars():
-    """Set environment variables for testing"""
+    """Set environment variables for the whole test session
+    
+    Tests that need a different value should override it with monkeypatch.setenv.
+    """
     with patch.dict(os.environ, {
             'NARRATOR_LOG_LEVEL': 'DEBUG',
     'NARRATOR_DB_ECHO': 'false',
@@ -22,26 +33,54 @@ def mock_env_vars():
 @pytest_asyncio.fixture
 async def memory_thread_store():
     """Create an in-memory thread store for testing"""
-    from narrator import ThreadStore
     store = await ThreadStore.create()  # No URL = memory backend
     return store
 
 @pytest_asyncio.fixture
 async def temp_file_store():
     """Create a temporary file store for testing"""
-    import tempfile
-    from narrator import FileStore
-    
     with tempfile.TemporaryDirectory() as temp_dir:
         store = await FileStore.create(base_path=temp_dir)
         yield store
 
+class FakeFileStore:
+    """Lightweight async FileStore stand-in that records its calls"""
+    
+    def __init__(self):
+        self.save_result = {
+            'id': 'file-123',
+            'storage_path': '/path/to/stored/file.txt',
+            'storage_backend': 'local'
+        }
+        self.get_result = b"Stored content"
+        self.save_error = None
+        self.save_calls = []
+        self.get_calls = []
+    
+    async def save(self, *args, **kwargs):
+        self.save_calls.append((args, kwargs))
+        if self.save_error is not None:
+            raise self.save_error
+        return self.save_result
+    
+    async def get(self, *args, **kwargs):
+        self.get_calls.append((args, kwargs))
+        return self.get_result
+
+@pytest.fixture
+def fake_file_store():
+    """Create a fake FileStore with canned save/get results"""
+    return FakeFileStore()
+
 @pytest.fixture
 def sample_thread():
     """Create a sample thread for testing"""
-    from narrator import Thread, Message
-    
     thread = Thread(title="Test Thread")
     thread.add_message(Message(role="user", content="Hello"))
     thread.add_message(Message(role="assistant", content="Hi there!"))
-    return thread 
\ No newline at end of file
+    return thread
+
+@pytest.fixture(scope="session")
+def shared_text_attachment():
+    """Create a read-only attachment with inline content, shared across the session"""
+    return Attachment(filename="test.txt", content=b"Test content")
@@ -3,7 +3,6 @@ from narrator import Attachment
 import base64
 import os
 import tempfile
-from unittest.mock import patch, Mock, AsyncMock
 
 @pytest.fixture
 def sample_attachment():
@@ -83,7 +82,7 @@ def test_attachment_serialization(sample_attachment):
     assert new_attachment.content is None  # Content not included in serialization
 
 @pytest.mark.asyncio
-async def test_get_content_bytes():
+async def test_get_content_bytes(fake_file_store):
     """Test getting content as bytes."""
     # Test with bytes content
     bytes_content = b"Test content"
@@ -119,16 +118,12 @@ async def test_get_content_bytes():
         storage_path="/path/to/file.txt"
     )
     
-    # Create a mock FileStore directly
-    mock_store = Mock()
-    mock_store.get = AsyncMock(return_value=b"Stored content")
-    
-    content = await attachment.get_content_bytes(file_store=mock_store)
+    content = await attachment.get_content_bytes(file_store=fake_file_store)
     assert content == b"Stored content"
-    mock_store.get.assert_called_once_with("test-file", "/path/to/file.txt")
+    assert fake_file_store.get_calls == [(("test-file", "/path/to/file.txt"), {})]
 
 @pytest.mark.asyncio
-async def test_ensure_stored():
+async def test_ensure_stored(fake_file_store):
     """Test ensuring content is stored."""
     content = b"Test content"
     attachment = Attachment(
@@ -137,18 +132,10 @@ async def test_ensure_stored():
         mime_type="text/plain"
     )
 
-    # Mock the file store directly
-    mock_store = Mock()
-    mock_store.save = AsyncMock(return_value={
-        'id': 'file-123',
-        'storage_path': '/path/to/stored/file.txt',
-        'storage_backend': 'local'
-    })
-    
-    await attachment.process_and_store(file_store=mock_store)
+    await attachment.process_and_store(file_store=fake_file_store)
     
     # Verify the file was stored
-    mock_store.save.assert_called_once_with(content, "test.txt", "text/plain")
+    assert fake_file_store.save_calls == [((content, "test.txt", "text/plain"), {})]
     assert attachment.file_id == "file-123"
     assert attachment.storage_path == "/path/to/stored/file.txt"
     assert attachment.storage_backend == "local"
@@ -267,7 +254,7 @@ def test_attachment_size_calculation():
     assert len(content) == len(content)  # Size is calculated on demand
 
 @pytest.mark.asyncio
-async def test_attachment_process_error_handling():
+async def test_attachment_process_error_handling(fake_file_store):
     """Test error handling during content processing."""
     attachment = Attachment(
         filename="test.bin",
@@ -275,15 +262,14 @@ async def test_attachment_process_error_handling():
         mime_type="application/octet-stream"
     )
 
-    # Mock the file store to raise an error
-    mock_store = Mock()
-    mock_store.save = AsyncMock(side_effect=Exception("Storage failed"))
+    # Make the file store raise an error
+    fake_file_store.save_error = Exception("Storage failed")
     
     with pytest.raises(RuntimeError, match="Failed to process attachment test.bin"):
-        await attachment.process_and_store(file_store=mock_store)
+        await attachment.process_and_store(file_store=fake_file_store)
 
 @pytest.mark.asyncio
-async def test_attachment_with_file_store():
+async def test_attachment_with_file_store(fake_file_store):
     """Test attachment processing with file store."""
     content = b"Test content"
     attachment = Attachment(
@@ -292,15 +278,7 @@ async def test_attachment_with_file_store():
         mime_type="text/plain"
     )
 
-    # Mock the file store
-    mock_store = Mock()
-    mock_store.save = AsyncMock(return_value={
-        'id': 'file-123',
-        'storage_path': '/path/to/stored/file.txt',
-        'storage_backend': 'local'
-    })
-    
-    await attachment.process_and_store(file_store=mock_store)
+    await attachment.process_and_store(file_store=fake_file_store)
     
     # Verify the file was stored
     assert attachment.file_id == "file-123"
@@ -309,7 +287,7 @@ async def test_attachment_with_file_store():
     assert attachment.content is None  # Content should be cleared after storage
 
 @pytest.mark.asyncio
-async def test_filename_update_after_storage():
+async def test_filename_update_after_storage(fake_file_store):
     """Test that the filename is updated to match the new filename created by the file store."""
     original_filename = "original_test.txt"
     content = b"Test content"
@@ -323,15 +301,13 @@ async def test_filename_update_after_storage():
     new_filename = "abc123def456.txt"
     storage_path = f"ab/{new_filename}"  # Mimics the sharded structure
 
-    # Create a mock file store directly
-    mock_store = Mock()
-    mock_store.save = AsyncMock(return_value={
+    fake_file_store.save_result = {
         'id': 'file-123',
         'storage_path': storage_path,
         'storage_backend': 'local'
-    })
+    }
     
-    await attachment.process_and_store(file_store=mock_store)
+    await attachment.process_and_store(file_store=fake_file_store)
     
     # Verify the filename was updated
     assert attachment.filename == new_filename
@@ -361,6 +337,17 @@ def test_attachment_equality():
         mime_type="text/plain"
     )
     assert attachment1.id != attachment3.id
+    
+    # Equality compares every field, not just the content hash
+    assert attachment1 == attachment2
+    assert attachment1 != attachment3
+    attachment2.mime_type = "application/pdf"
+    assert attachment1 != attachment2
+    
+    stored1 = Attachment(filename="test.txt", file_id="file-1", storage_path="a/test.txt", status="stored")
+    stored2 = Attachment(filename="test.txt", file_id="file-2", storage_path="b/test.txt", status="stored")
+    assert stored1.id == stored2.id
+    assert stored1 != stored2
 
 def test_attachment_from_file_path():
     """Test creating attachment from file path."""
@@ -393,4 +380,28 @@ def test_attachment_mime_type_detection():
         mime_type="image/jpeg"
     )
     # MIME type should remain as set
-    assert image_attachment.mime_type == "image/jpeg" 
\ No newline at end of file
+    assert image_attachment.mime_type == "image/jpeg" 
+
+def test_attachment_id_cached_until_inputs_change():
+    """Test that the id is cached and recomputed after its inputs change."""
+    attachment = Attachment(
+        filename="test.txt",
+        content=b"Test content",
+        mime_type="text/plain"
+    )
+    original_id = attachment.id
+    assert attachment.__dict__["id"] == original_id
+
+    # Unrelated fields keep the cached id
+    attachment.status = "stored"
+    assert attachment.__dict__["id"] == original_id
+
+    attachment.content = b"Different content"
+    assert "id" not in attachment.__dict__
+    assert attachment.id != original_id
+    assert attachment.id == Attachment(filename="test.txt", content=b"Different content").id
+
+    # Copies made with changed inputs recompute it too
+    copy = attachment.model_copy(update={"content": b"Copied content"})
+    assert copy.id == Attachment(filename="test.txt", content=b"Copied content").id
+    assert attachment.model_copy(update={"status": "failed"}).id == attachment.id
@@ -364,4 +364,46 @@ async def test_mime_type_detection(temp_store: FileStore):
     # Test with explicit MIME type override
     json_content = b'{"key": "value"}'
     result = await temp_store.save(content=json_content, filename='data.json', mime_type='application/json')
-    assert result['mime_type'] == 'application/json' 
\ No newline at end of file
+    assert result['mime_type'] == 'application/json' 
+
+@pytest.mark.asyncio
+async def test_create_validates_each_path_once(temp_dir, monkeypatch):
+    """Test that repeated create() calls for the same path skip the storage probe"""
+    await FileStore.create(base_path=temp_dir)
+    
+    async def fail_size_scan(self):
+        raise AssertionError("storage probe should not run again")
+    monkeypatch.setattr(FileStore, "get_storage_size", fail_size_scan)
+    
+    # Same path: returns a fresh, configured instance without re-validating
+    store = await FileStore.create(base_path=temp_dir, max_file_size=1024)
+    assert store.base_path == Path(temp_dir)
+    assert store.max_file_size == 1024
+    
+    # A path that is no longer writable is probed again
+    monkeypatch.setattr(os, "access", lambda path, mode: False)
+    with pytest.raises(FileStoreError, match="storage probe should not run again"):
+        await FileStore.create(base_path=temp_dir)
+
+@pytest.mark.asyncio
+async def test_validate_file_guesses_mime_type_from_extension(file_store):
+    """Test MIME type lookup from the filename extension"""
+    assert await file_store.validate_file(b"text", "notes.TXT") == "text/plain"
+    assert await file_store.validate_file(b"{}", "data.json") == "application/json"
+    # No extension falls back to content detection
+    assert await file_store.validate_file(b"plain text content", "README") == "text/plain"
+    
+    # Encoding and compound suffixes resolve as mimetypes.guess_type does
+    from narrator.storage.file_store import _guess_mime_type
+    assert _guess_mime_type("a.tgz") == "application/x-tar"
+    assert _guess_mime_type("a.tar.gz") == "application/x-tar"
+    assert _guess_mime_type("notes.txt.gz") == "text/plain"
+    assert _guess_mime_type(".pdf") is None
+
+@pytest.mark.asyncio
+async def test_save_and_get_large_file(file_store):
+    """Test round-tripping a file above the inline I/O threshold"""
+    from narrator.storage.file_store import INLINE_IO_THRESHOLD
+    content = b"x" * (INLINE_IO_THRESHOLD + 1)
+    metadata = await file_store.save(content, "large.txt", "text/plain")
+    assert await file_store.get(metadata['id'], metadata['storage_path']) == content
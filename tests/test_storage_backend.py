@@ -5,7 +5,6 @@ from datetime import datetime, UTC
 
 from narrator.database.storage_backend import MemoryBackend, SQLBackend
 from narrator import Thread, Message
-from narrator.database.models import Base
 
 
 @pytest.fixture
@@ -36,9 +35,11 @@ async def test_memory_backend_save_get_delete(sample_thread):
     assert len(threads) >= 1
 
     # Delete thread
+    assert await backend.exists(sample_thread.id) is True
     success = await backend.delete(sample_thread.id)
     assert success is True
     assert await backend.get(sample_thread.id) is None
+    assert await backend.exists(sample_thread.id) is False
 
 
 @pytest.mark.asyncio
@@ -71,16 +72,35 @@ async def test_memory_backend_find(sample_thread):
     assert found_platform[0].id == thread1.id
 
 
+@pytest.mark.asyncio
+async def test_memory_backend_find_messages_by_attribute(sample_thread):
+    backend = MemoryBackend()
+    await backend.initialize()
+
+    sample_thread.add_message(Message(role='assistant', content='Hi', platforms={'slack': {'ts': '123.456'}}))
+    await backend.save(sample_thread)
+
+    # A matching path returns a record for the message
+    records = await backend.find_messages_by_attribute('platforms.slack.ts', '123.456')
+    assert len(records) == 1
+    assert records[0].content == 'Hi'
+    assert records[0].thread_id == sample_thread.id
+    assert records[0].platforms['slack']['ts'] == '123.456'
+    assert len(await backend.find_messages_by_attribute('role', 'user')) == 1
+    
+    # Paths that don't resolve to the value find nothing
+    assert await backend.find_messages_by_attribute('platforms.slack.ts', 'other') == []
+    assert await backend.find_messages_by_attribute('platforms.notion.ts', '123.456') == []
+    assert await backend.find_messages_by_attribute('content.ts', '123.456') == []
+    assert await backend.find_messages_by_attribute('attachments', '123.456') == []
+
+
 @pytest.mark.asyncio
 async def test_sql_backend_save_get_delete(tmp_path, sample_thread):
     # Create a temporary in-memory SQLite backend
     backend = SQLBackend(":memory:")
     await backend.initialize()
 
-    # Create tables
-    async with backend.engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
     # Save thread
     saved = await backend.save(sample_thread)
     assert saved.id == sample_thread.id
@@ -95,9 +115,11 @@ async def test_sql_backend_save_get_delete(tmp_path, sample_thread):
     assert len(threads) >= 1
 
     # Delete thread
+    assert await backend.exists(sample_thread.id) is True
     success = await backend.delete(sample_thread.id)
     assert success is True
     assert await backend.get(sample_thread.id) is None
+    assert await backend.exists(sample_thread.id) is False
 
 
 @pytest.mark.asyncio
@@ -105,10 +127,6 @@ async def test_sql_backend_find(tmp_path):
     # Create a temporary in-memory SQLite backend
     backend = SQLBackend(":memory:")
     await backend.initialize()
-    
-    # Create tables
-    async with backend.engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
 
     # Create and save test threads
     thread1 = Thread(id='sql-thread-1', title='SQL Thread 1')
@@ -145,10 +163,6 @@ async def test_sql_backend_list_recent(tmp_path):
     backend = SQLBackend(":memory:")
     await backend.initialize()
 
-    # Create tables
-    async with backend.engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
     # Create threads with slight delays
     threads = []
     for i in range(3):
@@ -172,10 +186,6 @@ async def test_save_thread(tmp_path, sample_thread):
     db_path = f"sqlite+aiosqlite:///{tmp_path}/test.db"
     backend = SQLBackend(db_path)
     await backend.initialize()
-    
-    # Create tables
-    async with backend.engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
 
     # Save thread
     saved = await backend.save(sample_thread)
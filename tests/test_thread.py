@@ -2,9 +2,9 @@ import pytest
 from datetime import datetime, UTC, timedelta
 from narrator import Thread, Message, Attachment
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_thread():
-    """Create a sample thread for testing."""
+    """Create a sample thread for testing, shared read-only across this module."""
     thread = Thread(
         id="test-thread",
         title="Test Thread",
@@ -43,6 +43,8 @@ def test_add_message():
     assert thread.messages[0].role == "user"
     assert thread.messages[0].content == "Hello"
     assert thread.messages[0].sequence == 1
+    assert thread.messages[0].turn == 1
+    assert {"sequence", "turn"} <= thread.messages[0].model_fields_set
 
 def test_thread_serialization(sample_thread):
     """Test thread serialization to/from dict"""
@@ -76,6 +78,33 @@ def test_thread_serialization(sample_thread):
         assert new_msg.role == orig_msg.role
         assert new_msg.content == orig_msg.content
         assert new_msg.sequence == orig_msg.sequence
+    
+    # Trusted round trip skips validation but yields an equal thread
+    trusted = Thread.from_trusted(data_with_dates)
+    assert trusted == sample_thread
+    assert trusted.get_current_turn() == sample_thread.get_current_turn()
+    
+    # The copy shares no mutable state with the original
+    message_id = sample_thread.messages[-1].id
+    assert trusted.add_reaction(message_id, ":thumbsup:", "user1")
+    trusted.attributes["copied"] = True
+    assert sample_thread.get_reactions(message_id) == {}
+    assert "copied" not in sample_thread.attributes
+
+def test_from_trusted_treats_naive_datetimes_as_utc():
+    """Test that from_trusted normalizes naive datetimes to UTC"""
+    naive = datetime(2024, 2, 7, 12, 0)
+    thread = Thread.from_trusted({
+        "id": "test-thread",
+        "created_at": naive,
+        "updated_at": naive,
+        "messages": [{"id": "msg-1", "role": "user", "content": "Hello", "sequence": 1, "turn": 1, "timestamp": naive}]
+    })
+    assert thread.created_at.tzinfo == UTC
+    assert thread.updated_at.tzinfo == UTC
+    assert thread.messages[0].timestamp == naive.replace(tzinfo=UTC)
+    assert thread.title == "Untitled Thread"
+    assert thread.get_message_by_id("msg-1") is thread.messages[0]
 
 @pytest.mark.asyncio
 async def test_get_messages_for_chat_completion(sample_thread):
@@ -115,7 +144,7 @@ def test_message_sequencing():
     assert thread.messages[0].sequence == 0
     
     # Get non-system messages in order
-    non_system = [m for m in thread.messages if m.role != "system"]
+    non_system = thread.non_system_messages
     assert len(non_system) == 3
     assert non_system[0].content == "First user message"
     assert non_system[0].sequence == 1
@@ -123,6 +152,17 @@ def test_message_sequencing():
     assert non_system[1].sequence == 2
     assert non_system[2].content == "Second user message"
     assert non_system[2].sequence == 3
+    
+    # The returned list is a copy, and direct appends are picked up
+    non_system.clear()
+    thread.messages.append(Message(role="assistant", content="Appended directly"))
+    assert [m.content for m in thread.non_system_messages][-2:] == ["Second user message", "Appended directly"]
+    
+    # Messages inserted anywhere in the list are reflected once, in list order
+    thread.messages.insert(0, Message(role="system", content="Inserted system message"))
+    assert [m.content for m in thread.non_system_messages] == [
+        "First user message", "First assistant message", "Second user message", "Appended directly"
+    ]
 
 def test_thread_with_attachments():
     """Test thread with message attachments"""
@@ -265,7 +305,7 @@ def test_thread_message_ordering():
     thread.add_message(msg1)
     
     # Messages should maintain sequence order
-    messages = [m for m in thread.messages if m.role != "system"]
+    messages = thread.non_system_messages
     assert len(messages) == 3
     assert messages[0].sequence == 1
     assert messages[1].sequence == 2
@@ -313,6 +353,29 @@ def test_get_total_tokens():
     assert token_usage["by_model"]["gpt-4.1"]["completion_tokens"] == 30
     assert token_usage["by_model"]["gpt-4.1"]["prompt_tokens"] == 20
     assert token_usage["by_model"]["gpt-4.1"]["total_tokens"] == 50
+    
+    # Totals pick up messages added after the first call
+    thread.add_message(Message(
+        role="assistant",
+        content="More",
+        metrics={"model": "gpt-4.1-mini", "usage": {"completion_tokens": 1, "prompt_tokens": 2, "total_tokens": 3}}
+    ))
+    token_usage = thread.get_total_tokens()
+    assert token_usage["overall"]["total_tokens"] == 53
+    assert token_usage["by_model"]["gpt-4.1-mini"]["total_tokens"] == 3
+    assert thread.get_model_usage("gpt-4.1")["calls"] == 2
+    
+    # Returned dictionaries are copies
+    token_usage["overall"]["total_tokens"] = 0
+    assert thread.get_total_tokens()["overall"]["total_tokens"] == 53
+    
+    # Replacing the message list resets the totals
+    thread.messages = [msg1]
+    assert thread.get_total_tokens()["overall"]["total_tokens"] == 15
+    
+    # Metrics set on a message after an earlier call are counted
+    msg1.metrics = {"model": "gpt-4.1", "usage": {"completion_tokens": 1, "prompt_tokens": 1, "total_tokens": 2}}
+    assert thread.get_total_tokens()["overall"]["total_tokens"] == 2
 
 def test_get_model_usage():
     """Test getting model usage statistics"""
@@ -397,6 +460,14 @@ def test_get_message_timing_stats():
     assert timing_stats["average_latency"] == 1500.0  # 1.5 seconds = 1500 milliseconds
     assert timing_stats["message_count"] == 2
 
+    # Messages without a latency are left out, and later messages are counted
+    thread.add_message(Message(role="user", content="No timing"))
+    thread.add_message(Message(role="assistant", content="Slow", metrics={"timing": {"latency": 3000.0}}))
+    timing_stats = thread.get_message_timing_stats()
+    assert timing_stats["total_latency"] == 6000.0
+    assert timing_stats["average_latency"] == 2000.0
+    assert timing_stats["message_count"] == 3
+
 def test_get_message_counts():
     """Test getting message counts by role"""
     thread = Thread(id="test-thread")
@@ -414,6 +485,19 @@ def test_get_message_counts():
     assert counts["assistant"] == 1
     assert counts["tool"] == 1
 
+    # Counts follow later changes, and the returned dict is a copy
+    counts["user"] = 100
+    thread.add_message(Message(role="user", content="User message 3"))
+    thread.messages = thread.messages[1:]
+    counts = thread.get_message_counts()
+    assert counts == {"system": 0, "user": 3, "assistant": 1, "tool": 1}
+    
+    # As do messages inserted in place
+    system_msg = Message(role="system", content="Inserted system message")
+    thread.messages.insert(0, system_msg)
+    assert thread.get_message_counts()["system"] == 1
+    assert thread.get_system_message() is system_msg
+
 def test_get_tool_usage():
     """Test getting tool usage statistics"""
     thread = Thread(id="test-thread")
@@ -512,6 +596,42 @@ def test_thread_reactions():
     updated_reactions = thread.get_reactions(message.id)
     assert "user1" not in updated_reactions[":thumbsup:"]
     assert "user3" in updated_reactions[":thumbsup:"]
+    
+    # Add several reactions at once; existing pairs and unknown messages add nothing
+    assert thread.add_reactions(message.id, [(":tada:", "user1"), (":thumbsup:", "user3"), (":tada:", "user2")]) == 2
+    assert thread.get_reactions(message.id)[":tada:"] == ["user1", "user2"]
+    assert thread.add_reactions("nonexistent", [(":tada:", "user1")]) == 0
+
+def test_get_message_by_id_after_list_changes():
+    """Test message lookup by ID stays correct as the message list changes"""
+    thread = Thread(id="test-thread")
+    user_msg = Message(role="user", content="Hello")
+    thread.add_message(user_msg)
+    assert thread.get_message_by_id(user_msg.id) is user_msg
+    assert thread.get_message_by_id("nonexistent") is None
+    
+    # System messages are inserted at the front, shifting positions
+    system_msg = Message(role="system", content="System prompt")
+    thread.add_message(system_msg)
+    assert thread.get_message_by_id(system_msg.id) is system_msg
+    assert thread.get_message_by_id(user_msg.id) is user_msg
+    
+    # Messages appended directly to the list are found too
+    direct_msg = Message(role="assistant", content="Appended directly")
+    thread.messages.append(direct_msg)
+    assert thread.get_message_by_id(direct_msg.id) is direct_msg
+    
+    # Replacing the list drops the old messages
+    replacement = Message(role="user", content="Replacement")
+    thread.messages = [replacement]
+    assert thread.get_message_by_id(user_msg.id) is None
+    assert thread.get_message_by_id(replacement.id) is replacement
+    
+    # Replacing a message in place is picked up as well
+    swapped = Message(role="user", content="Swapped")
+    thread.messages[0] = swapped
+    assert thread.get_message_by_id(replacement.id) is None
+    assert thread.get_message_by_id(swapped.id) is swapped
 
 def test_get_system_message():
     """Test getting system message from thread"""
@@ -536,6 +656,15 @@ def test_get_system_message():
     assert found_system is not None
     assert found_system.role == "system"
     assert found_system.content == "You are helpful"
+    
+    # A later system message goes to the front and becomes the one returned
+    new_system_msg = Message(role="system", content="You are concise")
+    thread.add_message(new_system_msg)
+    assert thread.get_system_message() is new_system_msg
+    
+    # Dropping it from the list brings back the earlier one
+    thread.messages.remove(new_system_msg)
+    assert thread.get_system_message() is system_msg
 
 def test_get_messages_in_sequence():
     """Test getting messages sorted by sequence"""
@@ -556,6 +685,16 @@ def test_get_messages_in_sequence():
     assert ordered[0].role == "system"  # sequence 0
     assert ordered[1].content == "Second"  # sequence 1
     assert ordered[2].content == "First"  # sequence 2
+    
+    # Messages placed out of order directly in the list are still sorted
+    thread.messages.append(Message(role="user", content="Early", sequence=1))
+    ordered = thread.get_messages_in_sequence()
+    assert [m.sequence for m in ordered] == [0, 1, 1, 2]
+    assert ordered is not thread.messages
+    
+    # As are messages reordered in place
+    thread.messages.reverse()
+    assert [m.sequence for m in thread.get_messages_in_sequence()] == [0, 1, 1, 2]
 
 def test_get_message_by_id():
     """Test finding a message by ID"""
@@ -597,6 +736,14 @@ def test_message_turn_assignment():
     
     # Verify current turn
     assert thread.get_current_turn() == 3
+    
+    # Numbering follows the list after it is edited in place
+    thread.messages.pop()
+    assert thread.get_current_turn() == 2
+    thread.messages.insert(0, Message(role="user", content="Imported", turn=7, sequence=9))
+    thread.add_message(Message(role="assistant", content="Next"))
+    assert thread.messages[-1].turn == 8
+    assert thread.messages[-1].sequence == 10
 
 def test_same_turn_parameter():
     """Test the same_turn parameter for grouping messages"""
@@ -653,9 +800,22 @@ def test_add_messages_batch():
     assert thread.messages[2].sequence == 3
     assert thread.messages[3].sequence == 4
     assert thread.messages[4].sequence == 5
-    
+
     assert thread.get_current_turn() == 2
 
+    # A system message in a batch still goes to the front without gaps in the sequence
+    thread.add_messages_batch([
+        Message(role="user", content="Another question"),
+        Message(role="system", content="System prompt"),
+        Message(role="assistant", content="Another answer")
+    ])
+    assert thread.messages[0].role == "system"
+    assert thread.messages[0].sequence == 0
+    assert [m.sequence for m in thread.messages[-2:]] == [6, 7]
+    assert [m.turn for m in thread.messages[-2:]] == [3, 3]
+    assert thread.get_message_counts()["system"] == 1
+    assert thread.get_current_turn() == 3
+
 def test_get_messages_by_turn():
     """Test retrieving messages by turn number"""
     thread = Thread(id="test-thread")
@@ -687,6 +847,11 @@ def test_get_messages_by_turn():
     # Test non-existent turn
     empty_turn = thread.get_messages_by_turn(99)
     assert len(empty_turn) == 0
+    
+    # Later messages land in their turn
+    thread.add_message(Message(role="tool", content="Result", tool_call_id="call_1"), same_turn=True)  # turn 3
+    assert [m.content for m in thread.get_messages_by_turn(3)] == ["Answer 2", "Result"]
+    assert thread.get_turns_summary()[3]["roles"] == {"assistant": 1, "tool": 1}
 
 def test_get_current_turn():
     """Test getting the current turn number"""
@@ -710,6 +875,13 @@ def test_get_current_turn():
     # Add next message in new turn
     thread.add_message(Message(role="user", content="How are you?"))
     assert thread.get_current_turn() == 2
+    
+    # Clearing the thread starts numbering over
+    thread.clear_messages()
+    assert thread.get_current_turn() == 0
+    thread.add_message(Message(role="user", content="Fresh start"))
+    assert thread.messages[0].turn == 1
+    assert thread.messages[0].sequence == 1
 
 def test_get_turns_summary():
     """Test getting summary of all turns"""
@@ -856,6 +1028,5 @@ def test_mixed_turn_scenarios():
     assert turn3[0].role == "user"
     
     # Verify sequences are still correct
-    all_messages = [m for m in thread.messages if m.role != "system"]
-    sequences = [m.sequence for m in all_messages]
+    sequences = [m.sequence for m in thread.non_system_messages]
     assert sequences == [1, 2, 3, 4, 5, 6, 7]  # Should be sequential 
\ No newline at end of file
@@ -1,34 +1,72 @@
+import asyncio
 import pytest
 import pytest_asyncio
 import os
 from pathlib import Path
 import tempfile
-from datetime import datetime, UTC
-from sqlalchemy import select, text
+from datetime import datetime, UTC, timedelta
+from sqlalchemy import event, insert, select, text
 from sqlalchemy.orm import selectinload
 from narrator import Thread, Message, Attachment, ThreadStore
 from narrator.database.storage_backend import MemoryBackend, SQLBackend
-from narrator.database.models import Base
+from narrator.database.models import Base, ThreadRecord
 
 pytest_plugins = ('pytest_asyncio',)
 
+# The shared store's engine lives on the session loop, so run every test there too
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# Titles for the pagination test's seeded threads, oldest first
+_PAGINATION_TITLES = tuple(f"Thread {i}" for i in range(15))
+
 @pytest.fixture
 def env_vars():
     """Save and restore environment variables."""
     yield
 
-@pytest_asyncio.fixture
-async def thread_store():
-    """Create a ThreadStore for testing using SQLBackend with an in-memory DB."""
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _shared_thread_store():
+    """Create one ThreadStore using SQLBackend with an in-memory DB for the whole session."""
     # Use factory pattern for immediate initialization
     store = await ThreadStore.create(":memory:")
-    async with store._backend.engine.begin() as conn:
-        # Reset tables for testing
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
+    
+    # Run the common statements once so tests start with them in the engine's compiled cache
+    warmup = Thread(id="warmup-thread")
+    warmup.add_message(Message(role="user", content="Warm up"))
+    await store.save(warmup)
+    await store.save(warmup)
+    await store.get(warmup.id)
+    await store.list(limit=1)
+    await store.exists(warmup.id)
+    await store.delete(warmup.id)
     yield store
     await store._backend.engine.dispose()
 
+@pytest_asyncio.fixture(loop_scope="session")
+async def thread_store(_shared_thread_store):
+    """Provide the shared in-memory ThreadStore with every table emptied."""
+    store = _shared_thread_store
+    async with store._backend.engine.begin() as conn:
+        # Reset tables for testing in a single transaction
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(table.delete())
+    return store
+
+def _disable_sqlite_durability(engine):
+    """Turn off journaling and fsyncs on every connection of a file-backed test engine"""
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=OFF")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+async def _bulk_seed(store, rows):
+    """Insert thread rows straight into the threads table with one executemany"""
+    async with store.engine.begin() as conn:
+        await conn.execute(insert(ThreadRecord), rows)
+
 @pytest.fixture
 def sample_thread():
     """Create a sample thread for testing."""
@@ -37,7 +75,6 @@ def sample_thread():
     thread.updated_at = datetime.now(UTC)
     return thread
 
-@pytest.mark.asyncio
 async def test_thread_store_init():
     """Test ThreadStore initialization using factory pattern"""
     # Use the factory pattern for creation and initialization
@@ -56,7 +93,6 @@ async def test_thread_store_init():
     # Clean up
     await store._backend.engine.dispose()
 
-@pytest.mark.asyncio
 async def test_factory_pattern():
     """Test the ThreadStore.create factory method"""
     # Create with in-memory backend
@@ -83,7 +119,6 @@ async def test_factory_pattern():
     await sql_store._backend.engine.dispose()
     await store._backend.engine.dispose()
 
-@pytest.mark.asyncio
 async def test_auto_initialization():
     """Test that ThreadStore initializes automatically when operations are performed."""
     # Create store without explicitly initializing
@@ -109,7 +144,6 @@ async def test_auto_initialization():
     # Clean up
     await store._backend.engine.dispose()
 
-@pytest.mark.asyncio
 async def test_thread_store_default_url():
     """Test ThreadStore initialization with default behavior."""
     # Test both initialization methods
@@ -125,7 +159,6 @@ async def test_thread_store_default_url():
     assert factory_store.database_url is None
     assert factory_store._initialized is True
 
-@pytest.mark.asyncio
 async def test_save_thread(thread_store, sample_thread):
     """Test saving a thread"""
     # Save the thread
@@ -138,7 +171,6 @@ async def test_save_thread(thread_store, sample_thread):
     assert len(fetched.messages) == 1
     assert fetched.messages[0].role == "user"
 
-@pytest.mark.asyncio
 async def test_get_thread(thread_store, sample_thread):
     """Test retrieving a thread"""
     # Save the thread first
@@ -153,16 +185,15 @@ async def test_get_thread(thread_store, sample_thread):
     assert retrieved_thread.messages[0].role == "user"
     assert retrieved_thread.messages[0].content == "Hello"
 
-@pytest.mark.asyncio
 async def test_get_nonexistent_thread(thread_store):
     """Test retrieving a non-existent thread"""
     thread = await thread_store.get("nonexistent-id")
     assert thread is None
+    assert await thread_store.exists("nonexistent-id") is False
 
-@pytest.mark.asyncio
 async def test_list_recent(thread_store):
     """Test listing recent threads"""
-    # Create and save multiple threads
+    # Create multiple threads and save them in one batch
     threads = []
     for i in range(3):
         thread = Thread(
@@ -170,8 +201,8 @@ async def test_list_recent(thread_store):
             title=f"Test Thread {i}"
         )
         thread.add_message(Message(role="user", content=f"Message {i}"))
-        await thread_store.save(thread)
         threads.append(thread)
+    assert await thread_store.save_many(threads) == threads
     
     # List recent threads
     recent_threads = await thread_store.list_recent(limit=2)
@@ -180,27 +211,54 @@ async def test_list_recent(thread_store):
     assert recent_threads[0].id == "test-thread-2"
     assert recent_threads[1].id == "test-thread-1"
 
-@pytest.mark.asyncio
+@pytest.mark.parametrize("database_url", [None, ":memory:"])
+async def test_save_many(database_url):
+    """Test saving several threads at once on both backends"""
+    store = await ThreadStore.create(database_url)
+    
+    existing = Thread(id="existing-thread", title="Old Title")
+    await store.save(existing)
+    existing.title = "New Title"
+    
+    new = Thread(id="new-thread")
+    new.add_message(Message(role="system", content="System prompt"))
+    message = Message(role="user", content="Hello")
+    message.attachments.append(Attachment(filename="test.txt", content=b"Test content", mime_type="text/plain"))
+    new.add_message(message)
+    
+    saved = await store.save_many([existing, new])
+    if database_url:
+        # The SQL backend stores attachments as part of saving
+        assert message.attachments[0].storage_path is not None
+    assert saved == [existing, new]
+    assert len(new.messages) == 2  # Original keeps its system message
+    
+    assert (await store.get("existing-thread")).title == "New Title"
+    loaded = await store.get("new-thread")
+    assert [m.role for m in loaded.messages] == ["user"]
+    
+    assert await store.save_many([]) == []
+    if database_url:
+        await store._backend.engine.dispose()
+
 async def test_delete_thread(thread_store, sample_thread):
     """Test deleting a thread"""
     # Save the thread first
     await thread_store.save(sample_thread)
+    assert await thread_store.exists(sample_thread.id) is True
     
     # Delete the thread
     success = await thread_store.delete(sample_thread.id)
     assert success is True
     
     # Verify it's gone
-    fetched = await thread_store.get(sample_thread.id)
-    assert fetched is None
+    assert await thread_store.exists(sample_thread.id) is False
 
-@pytest.mark.asyncio
 async def test_delete_nonexistent_thread(thread_store):
     """Test deleting a non-existent thread"""
     success = await thread_store.delete("nonexistent-id")
     assert success is False
 
-@pytest.mark.asyncio
 async def test_find_by_attributes(thread_store):
     """Test finding threads by attributes"""
     # Create threads with different attributes
@@ -218,7 +276,6 @@ async def test_find_by_attributes(thread_store):
     assert len(results) == 1
     assert results[0].id == "thread-1"
 
-@pytest.mark.asyncio
 async def test_find_by_platform(thread_store):
     """Test finding threads by platform"""
     # Create threads with different platforms
@@ -236,7 +293,6 @@ async def test_find_by_platform(thread_store):
     assert len(results) == 1
     assert results[0].id == "thread-1"
 
-@pytest.mark.asyncio
 async def test_thread_update(thread_store, sample_thread):
     """Test updating an existing thread"""
     # Save the initial thread
@@ -255,14 +311,18 @@ async def test_thread_update(thread_store, sample_thread):
     assert len(updated_thread.messages) == 2
     assert updated_thread.messages[1].role == "assistant"
     assert updated_thread.messages[1].content == "Response"
+    
+    # The update keeps the original creation time and moves updated_at on
+    assert updated_thread.created_at == sample_thread.created_at
+    assert updated_thread.updated_at >= sample_thread.updated_at
 
-@pytest.mark.asyncio
 async def test_thread_store_temp_cleanup():
     """Test that temporary database files are cleaned up."""
     # Create store with temp directory
     with tempfile.TemporaryDirectory() as temp_dir:
         db_path = os.path.join(temp_dir, "threads.db")
         store = ThreadStore(f"sqlite+aiosqlite:///{db_path}")
+        _disable_sqlite_durability(store.engine)
         await store.initialize()
         
         # Save a thread
@@ -274,6 +334,10 @@ async def test_thread_store_temp_cleanup():
         assert retrieved_thread is not None
         assert retrieved_thread.title == thread.title
         
+        # The test engine runs without a journal
+        async with store.engine.connect() as conn:
+            assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "off"
+        
         # Close store
         await store._backend.engine.dispose()
         
@@ -283,16 +347,11 @@ async def test_thread_store_temp_cleanup():
     # After exiting temp directory context, verify it's gone
     assert not os.path.exists(db_path)
 
-@pytest.mark.asyncio
 async def test_thread_store_connection_management():
     """Test proper connection management."""
     store = ThreadStore(":memory:")
     await store.initialize()
     
-    # Create tables
-    async with store._backend.engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    
     # Create and save multiple threads
     threads = []
     for i in range(5):
@@ -309,46 +368,32 @@ async def test_thread_store_connection_management():
     # Close all connections
     await store._backend.engine.dispose()
 
-@pytest.mark.asyncio
-async def test_thread_store_concurrent_access():
+async def test_thread_store_concurrent_access(thread_store):
     """Test concurrent access to thread store."""
-    store = ThreadStore(":memory:")
-    await store.initialize()
-    
-    # Create tables
-    async with store._backend.engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    
     thread = Thread()
-    await store.save(thread)
+    thread.add_message(Message(role="user", content="Seed message"))
+    await thread_store.save(thread)
     
     # Simulate concurrent access
-    async def update_thread():
+    async def update_thread(i):
         # Each operation should get its own session
-        retrieved = await store.get(thread.id)
-        retrieved.title = "Updated"
-        await store.save(retrieved)
-    
-    # Run multiple updates
-    for _ in range(5):
-        await update_thread()
-    
-    # Verify final state
-    final = await store.get(thread.id)
-    assert final.title == "Updated"
-    
-    await store._backend.engine.dispose()
-
-@pytest.mark.asyncio
-async def test_thread_store_json_serialization():
+        retrieved = await thread_store.get(thread.id)
+        retrieved.title = f"Updated {i}"
+        retrieved.add_message(Message(role="assistant", content=f"Update {i}"))
+        await thread_store.save(retrieved)
+    
+    # Run multiple updates concurrently; every save of the thread's messages succeeds
+    results = await asyncio.gather(*(update_thread(i) for i in range(5)), return_exceptions=True)
+    assert results == [None] * 5
+    
+    # Verify final state comes from the updates
+    final = await thread_store.get(thread.id)
+    assert final.title in {f"Updated {i}" for i in range(5)}
+    assert final.messages[0].content == "Seed message"
+    assert {m.content for m in final.messages[1:]} <= {f"Update {i}" for i in range(5)}
+
+async def test_thread_store_json_serialization(thread_store):
     """Test JSON serialization of complex thread data."""
-    store = ThreadStore(":memory:")
-    await store.initialize()
-    
-    # Create tables
-    async with store._backend.engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    
     thread = Thread()
     
     # Add complex data
@@ -360,69 +405,51 @@ async def test_thread_store_json_serialization():
     }
     
     # Save and retrieve
-    await store.save(thread)
-    retrieved = await store.get(thread.id)
+    await thread_store.save(thread)
+    retrieved = await thread_store.get(thread.id)
     
     # Verify complex data is preserved
     assert retrieved.attributes == thread.attributes
-    
-    await store._backend.engine.dispose()
 
-@pytest.mark.asyncio
-async def test_thread_store_error_handling():
+async def test_thread_store_error_handling(thread_store):
     """Test error handling in thread store operations."""
-    store = ThreadStore(":memory:")
-    await store.initialize()
-    
-    # Create tables
-    async with store._backend.engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    
     # Test invalid thread ID
-    assert await store.get("nonexistent") is None
+    assert await thread_store.get("nonexistent") is None
     
     # Test invalid JSON data
     thread = Thread()
     thread.attributes = {"invalid": object()}  # Object that can't be JSON serialized
     
     with pytest.raises(Exception):
-        await store.save(thread)
-        
-    await store._backend.engine.dispose()
+        await thread_store.save(thread)
 
-@pytest.mark.asyncio
-async def test_thread_store_pagination():
+async def test_thread_store_pagination(thread_store):
     """Test thread listing with pagination."""
-    store = ThreadStore(":memory:")
-    await store.initialize()
-    
-    # Create tables
-    async with store._backend.engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    
-    # Create 15 threads
-    threads = []
-    for i in range(15):
-        thread = Thread()
-        thread.title = f"Thread {i}"
-        await store.save(thread)
-        threads.append(thread)
+    # Seed 15 threads directly, each updated one second after the last
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    await _bulk_seed(thread_store, [
+        {
+            "id": f"thread-{i}",
+            "title": title,
+            "attributes": {},
+            "created_at": start + timedelta(seconds=i),
+            "updated_at": start + timedelta(seconds=i)
+        }
+        for i, title in enumerate(_PAGINATION_TITLES)
+    ])
     
     # Test different page sizes
-    page1 = await store.list(limit=5)
+    page1 = await thread_store.list(limit=5)
     assert len(page1) == 5
-    page2 = await store.list(limit=10, offset=5)
+    page2 = await thread_store.list(limit=10, offset=5)
     assert len(page2) == 10
-    all_threads = await store.list(limit=20)
-    assert len(all_threads) == 15
+    all_threads = await thread_store.list(limit=20)
+    assert len(all_threads) == len(_PAGINATION_TITLES)
     
     # Test ordering
-    recent = await store.list(limit=5)
-    assert recent[0].title == "Thread 14"  # Most recent first
-    
-    await store._backend.engine.dispose()
+    recent = await thread_store.list(limit=5)
+    assert recent[0].title == _PAGINATION_TITLES[-1]  # Most recent first
 
-@pytest.mark.asyncio
 async def test_message_sequence_preservation(thread_store):
     """Test that message sequences are preserved correctly in database while system messages are filtered"""
     # Create a thread with system and non-system messages
@@ -457,7 +484,6 @@ async def test_message_sequence_preservation(thread_store):
     assert loaded_thread.messages[2].content == "Second user message"
     assert loaded_thread.messages[2].sequence == 3
 
-@pytest.mark.asyncio
 async def test_save_thread_with_attachments(thread_store):
     """Test saving a thread with attachments ensures they are stored before returning"""
     # Create a thread with an attachment
@@ -487,7 +513,6 @@ async def test_save_thread_with_attachments(thread_store):
     assert retrieved_attachment.file_id is not None
     assert retrieved_attachment.storage_path is not None
 
-@pytest.mark.asyncio
 async def test_save_thread_with_multiple_attachments(thread_store):
     """Test saving a thread with multiple messages and attachments"""
     thread = Thread()
@@ -523,19 +548,83 @@ async def test_save_thread_with_multiple_attachments(thread_store):
     assert len(retrieved_thread.messages[0].attachments) == 1
     assert len(retrieved_thread.messages[1].attachments) == 2
 
-@pytest.mark.asyncio
+async def test_save_waits_for_all_attachments_on_failure(thread_store, monkeypatch):
+    """Test that a failed attachment write is reported only after the others finish"""
+    async def process_and_store(self, file_store, force=False):
+        if self.filename == "bad.txt":
+            raise OSError("disk full")
+        await asyncio.sleep(0.01)
+        self.status = "stored"
+    monkeypatch.setattr(Attachment, "process_and_store", process_and_store)
+    
+    thread = Thread()
+    message = Message(role="user", content="Two attachments")
+    good = Attachment(filename="good.txt", content=b"Good", mime_type="text/plain")
+    bad = Attachment(filename="bad.txt", content=b"Bad", mime_type="text/plain")
+    message.attachments.extend([good, bad])
+    thread.add_message(message)
+    
+    with pytest.raises(RuntimeError, match="disk full"):
+        await thread_store.save(thread)
+    assert good.status == "stored"
+    assert not await thread_store.exists(thread.id)
+
+async def test_save_and_get_statement_counts(thread_store):
+    """Test that save and get handle all of a thread's messages in a fixed number of statements"""
+    thread = Thread()
+    for i in range(3):
+        message = Message(role="user", content=f"Message {i}")
+        message.attachments.append(Attachment(filename=f"test{i}.txt", content=b"Content", mime_type="text/plain"))
+        thread.add_message(message)
+    
+    statements = []
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    sync_engine = thread_store.engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", count_statement)
+    try:
+        await thread_store.save(thread)
+        # Message rows (attachments included, as a JSON column) go in with one batched INSERT
+        assert sum(s.startswith("INSERT INTO messages") for s in statements) == 1
+        # The thread row is upserted, so nothing is read back first
+        assert not any(s.startswith("SELECT") for s in statements)
+        
+        statements.clear()
+        retrieved = await thread_store.get(thread.id)
+        assert all(len(m.attachments) == 1 for m in retrieved.messages)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", count_statement)
+    
+    # One query for the thread, one selectin query for its messages
+    assert len(statements) == 2
+
+async def test_save_reuses_attachment_file_store(thread_store):
+    """Test that the backend creates its attachment FileStore once"""
+    thread = Thread()
+    message = Message(role="user", content="Test with attachment")
+    message.attachments.append(Attachment(filename="test.txt", content=b"Test content", mime_type="text/plain"))
+    thread.add_message(message)
+    await thread_store.save(thread)
+    file_store = thread_store._backend._file_store
+    assert file_store is not None
+    
+    message = Message(role="user", content="Another attachment")
+    message.attachments.append(Attachment(filename="other.txt", content=b"Other content", mime_type="text/plain"))
+    thread.add_message(message)
+    await thread_store.save(thread)
+    assert thread_store._backend._file_store is file_store
+
 async def test_default_backend():
     """Test that ThreadStore defaults to MemoryBackend when no URL is provided"""
     store = ThreadStore()
     assert isinstance(store._backend, MemoryBackend)
 
-@pytest.mark.asyncio
 async def test_explicit_sql_backend():
     """Test that ThreadStore uses SQLBackend when URL is provided"""
     store = ThreadStore(":memory:")
     assert isinstance(store._backend, SQLBackend)
 
-@pytest.mark.asyncio
 async def test_system_messages_not_persisted(thread_store):
     """Test that system messages are not persisted to database"""
     # Create thread with system message
@@ -554,8 +643,7 @@ async def test_system_messages_not_persisted(thread_store):
     assert retrieved_thread.messages[0].role == "user"
     assert retrieved_thread.messages[0].content == "User message"
 
-@pytest.mark.asyncio
-async def test_system_prompt_preserved_in_memory():
+async def test_system_prompt_preserved_in_memory(thread_store):
     """Test that system messages are preserved in memory thread but not persisted"""
     # Create thread with system message
     thread = Thread(id="test-thread")
@@ -568,7 +656,6 @@ async def test_system_prompt_preserved_in_memory():
     assert thread.messages[1].role == "user"
     
     # Save thread
-    thread_store = await ThreadStore.create(":memory:")
     await thread_store.save(thread)
     
     # Thread in memory should still have system message after save
@@ -580,22 +667,16 @@ async def test_system_prompt_preserved_in_memory():
     retrieved_thread = await thread_store.get(thread.id)
     assert len(retrieved_thread.messages) == 1
     assert retrieved_thread.messages[0].role == "user"
-    
-    await thread_store._backend.engine.dispose()
 
-@pytest.mark.asyncio
-async def test_reaction_persistence():
+async def test_reaction_persistence(thread_store):
     """Test that message reactions are persisted correctly"""
-    thread_store = await ThreadStore.create(":memory:")
-    
     # Create thread with message
     thread = Thread(id="test-thread")
     message = Message(role="user", content="Test message")
     thread.add_message(message)
     
     # Add reactions
-    thread.add_reaction(message.id, ":thumbsup:", "user1")
-    thread.add_reaction(message.id, ":heart:", "user2")
+    assert thread.add_reactions(message.id, [(":thumbsup:", "user1"), (":heart:", "user2")]) == 2
     
     # Save thread
     await thread_store.save(thread)
@@ -609,13 +690,9 @@ async def test_reaction_persistence():
     assert ":heart:" in reactions
     assert "user1" in reactions[":thumbsup:"]
     assert "user2" in reactions[":heart:"]
-    
-    await thread_store._backend.engine.dispose()
 
-@pytest.mark.asyncio 
-async def test_turn_data_persistence():
+async def test_turn_data_persistence(thread_store):
     """Test that turn data is properly persisted to and retrieved from database"""
-    store = await ThreadStore.create(":memory:")
     thread = Thread(title="Turn Persistence Test")
     
     # Add messages with various turn configurations
@@ -635,32 +712,33 @@ async def test_turn_data_persistence():
     thread.add_message(Message(role="system", content="System prompt"))  # turn 0
     
     # Save to database
-    await store.save(thread)
+    await thread_store.save(thread)
     
     # Retrieve from database
-    retrieved = await store.get(thread.id)
+    retrieved = await thread_store.get(thread.id)
     assert retrieved is not None
     
     # Verify turn data is preserved (system messages not persisted)
     assert len(retrieved.messages) == 6  # 6 non-system messages
     
     # Find messages by content and verify turns
-    user_msg = next(m for m in retrieved.messages if m.content == "Question 1")
+    by_content = {m.content: m for m in retrieved.messages}
+    user_msg = by_content["Question 1"]
     assert user_msg.turn == 1
     
-    answer_1a = next(m for m in retrieved.messages if m.content == "Answer 1a")
+    answer_1a = by_content["Answer 1a"]
     assert answer_1a.turn == 1
     
-    answer_1b = next(m for m in retrieved.messages if m.content == "Answer 1b")
+    answer_1b = by_content["Answer 1b"]
     assert answer_1b.turn == 1
     
-    processing_msg = next(m for m in retrieved.messages if m.content == "Processing...")
+    processing_msg = by_content["Processing..."]
     assert processing_msg.turn == 2
     
-    tool_msg = next(m for m in retrieved.messages if m.content == "Tool result")
+    tool_msg = by_content["Tool result"]
     assert tool_msg.turn == 2
     
-    complete_msg = next(m for m in retrieved.messages if m.content == "Complete")
+    complete_msg = by_content["Complete"]
     assert complete_msg.turn == 2
     
     # Verify turn helper methods work after retrieval
@@ -674,13 +752,9 @@ async def test_turn_data_persistence():
     assert 2 in summary
     assert summary[1]["message_count"] == 3
     assert summary[2]["message_count"] == 3
-    
-    await store._backend.engine.dispose()
 
-@pytest.mark.asyncio
-async def test_turn_data_with_complex_scenarios():
+async def test_turn_data_with_complex_scenarios(thread_store):
     """Test turn functionality in complex real-world scenarios"""
-    store = await ThreadStore.create(":memory:")
     thread = Thread(title="Complex Turn Test")
     
     # System message (not persisted but should handle turn 0)
@@ -706,8 +780,8 @@ async def test_turn_data_with_complex_scenarios():
     thread.add_message(Message(role="user", content="Thanks for the info!"))
     
     # Save and retrieve
-    await store.save(thread)
-    retrieved = await store.get(thread.id)
+    await thread_store.save(thread)
+    retrieved = await thread_store.get(thread.id)
     
     # Verify complex turn structure
     assert retrieved.get_current_turn() == 3
@@ -736,6 +810,4 @@ async def test_turn_data_with_complex_scenarios():
     # Verify source data preserved with turns
     gpt_msg = next(m for m in turn1_msgs if "GPT-4" in m.content)
     assert gpt_msg.source["id"] == "gpt-4"
-    assert gpt_msg.turn == 1
-    
-    await store._backend.engine.dispose() 
\ No newline at end of file
+    assert gpt_msg.turn == 1 
\ No newline at end of file